@@ -7,18 +7,200 @@ OOP Proje - Kahve Dükkanı Yönetim Sistemi
 """
 
 import sys
-from managers.cafe_manager import CafeManager
-from models.customer import RegularCustomer, PremiumCustomer, VIPCustomer
-from models.order import Order, OrderStatus
-from utils.helpers import InputValidator, Formatter, MenuHelper, TablePrinter
+from managers.cafe_manager import get_cafe_manager
+from models.order import OrderStatus
+from utils.helpers import InputValidator, Formatter, MenuHelper, TablePrinter, SEPARATOR, THIN_SEPARATOR
+
+# Seçim numarası sırasıyla sabit değerler
+_CUSTOMER_TYPES = ("Regular", "Premium", "VIP")
+_CATEGORIES = ("Hot", "Cold", "Dessert", "Food")
+_SIZES = ("Small", "Medium", "Large")
+
+# Sabit menü seçenekleri (her ekran tek write ile basılır)
+_MAIN_MENU_LINES = (
+    "1️⃣  Kafeyi Aç/Kapat",
+    "2️⃣  Müşteri İşlemleri",
+    "3️⃣  Sipariş Ver (Müşteri Olarak)",
+    "4️⃣  Barista Paneli",
+    "5️⃣  Yönetici Paneli",
+    "6️⃣  Menüyü Görüntüle",
+    "7️⃣  Raporlar ve İstatistikler",
+    "0️⃣  Çıkış",
+)
+
+_CUSTOMER_MENU_LINES = (
+    "1. Yeni Müşteri Kaydet",
+    "2. Müşteri Listesi",
+    "3. Müşteri Ara",
+    "4. Müşteri Bakiye Ekle",
+    "5. Müşteri Sil",
+    "0. Geri Dön",
+)
+
+_CUSTOMER_TYPE_LINES = (
+    "\nMüşteri Tipi:",
+    "1. Regular (İndirim yok)",
+    "2. Premium (%10 indirim)",
+    "3. VIP (%20 indirim)",
+)
+
+_CART_MENU_LINES = (
+    "1. Ürün Ekle",
+    "2. Ürün Çıkar",
+    "3. Siparişi Tamamla",
+    "4. Sepeti Temizle",
+    "0. İptal Et",
+)
+
+_BARISTA_MENU_LINES = (
+    "1. Vardiya Başlat/Bitir",
+    "2. Bekleyen Siparişler",
+    "3. Sipariş Al ve Hazırla",
+    "4. Siparişi Tamamla",
+    "5. Barista Listesi",
+    "6. Barista İstatistikleri",
+    "0. Geri Dön",
+)
+
+_ADMIN_MENU_LINES = (
+    "1. Menü Yönetimi",
+    "2. Barista İşe Al/Çıkar",
+    "3. Tüm Siparişler",
+    "4. Sipariş İptal Et",
+    "5. Dashboard",
+    "0. Geri Dön",
+)
+
+_MENU_MANAGEMENT_LINES = (
+    "1. Menüyü Görüntüle",
+    "2. Ürün Ekle",
+    "3. Ürün Sil",
+    "4. Menü İstatistikleri",
+    "0. Geri Dön",
+)
+
+_CATEGORY_LINES = (
+    "\nKategori:",
+    "1. Hot",
+    "2. Cold",
+    "3. Dessert",
+    "4. Food",
+)
+
+_SIZE_LINES = (
+    "\nBoyut:",
+    "1. Small",
+    "2. Medium",
+    "3. Large",
+)
+
+_BARISTA_MANAGEMENT_LINES = (
+    "1. Barista İşe Al",
+    "2. Barista İşten Çıkar",
+    "0. Geri Dön",
+)
+
+_ORDER_FILTER_LINES = (
+    "1. Tüm Siparişler",
+    "2. Bekleyen Siparişler",
+    "3. Hazırlanan Siparişler",
+    "4. Hazır Siparişler",
+    "5. Teslim Edilen Siparişler",
+    "6. İptal Edilen Siparişler",
+    "0. Geri Dön",
+)
+
+# Sipariş filtresi seçimi -> (durum, başlık)
+_ORDER_FILTERS = {
+    "2": (OrderStatus.PENDING, "BEKLEYEN SİPARİŞLER"),
+    "3": (OrderStatus.PREPARING, "HAZIRLANAN SİPARİŞLER"),
+    "4": (OrderStatus.READY, "HAZIR SİPARİŞLER"),
+    "5": (OrderStatus.DELIVERED, "TESLİM EDİLEN SİPARİŞLER"),
+    "6": (OrderStatus.CANCELLED, "İPTAL EDİLEN SİPARİŞLER"),
+}
+
+_REPORT_MENU_LINES = (
+    "1. En Çok Satan Ürünler",
+    "2. En Çok Harcayan Müşteriler",
+    "3. Barista Performans Raporu",
+    "4. Dashboard",
+    "0. Geri Dön",
+)
+
+# Menülerin geçerli seçim numaraları (her ekranda yeniden oluşturulmaz)
+_CHOICES_0_TO_2 = (0, 1, 2)
+_CHOICES_0_TO_4 = (0, 1, 2, 3, 4)
+_CHOICES_0_TO_5 = (0, 1, 2, 3, 4, 5)
+_CHOICES_0_TO_6 = (0, 1, 2, 3, 4, 5, 6)
+_CHOICES_0_TO_7 = (0, 1, 2, 3, 4, 5, 6, 7)
+_CHOICES_1_TO_3 = (1, 2, 3)
+_CHOICES_1_TO_4 = (1, 2, 3, 4)
+
+# Ana menünün sabit kısmı modül yüklenirken bir kez UTF-8'e çevrilir
+_MAIN_MENU_FRAME = (
+    Formatter.format_header("☕ ANA MENÜ ☕", 60) + "\n" +
+    "\n".join(_MAIN_MENU_LINES) + "\n" +
+    "\n" + SEPARATOR + "\n"
+).encode("utf-8")
+
 
 class CoffeeShopApp:
     """Ana uygulama sınıfı"""
     
     def __init__(self):
-        self.manager = CafeManager("☕ COFFEE HEAVEN ☕")
+        self.manager = get_cafe_manager("☕ COFFEE HEAVEN ☕")
         self.current_customer = None
         self.running = True
+        
+        # Menü seçimleri -> işlem (if/elif zinciri yerine tek sözlük araması)
+        self._main_dispatch = {
+            "1": self.cafe_operations,
+            "2": self.customer_operations,
+            "3": self.customer_order_flow,
+            "4": self.barista_panel,
+            "5": self.admin_panel,
+            "6": self.show_menu,
+            "7": self.show_reports,
+            "0": self.exit_app,
+        }
+        self._customer_dispatch = {
+            "1": self.register_customer,
+            "2": self.list_customers,
+            "3": self.search_customer,
+            "4": self.add_customer_balance,
+            "5": self.remove_customer,
+        }
+        self._barista_dispatch = {
+            "1": self.barista_shift_operations,
+            "2": self.show_pending_orders,
+            "3": self.barista_take_order,
+            "4": self.barista_complete_order,
+            "5": self.list_baristas,
+            "6": self.barista_statistics,
+        }
+        self._admin_dispatch = {
+            "1": self.menu_management,
+            "2": self.barista_management,
+            "3": self.show_all_orders,
+            "4": self.cancel_order_admin,
+            "5": self.show_dashboard,
+        }
+        self._menu_management_dispatch = {
+            "1": self.show_menu,
+            "2": self.add_menu_item,
+            "3": self.remove_menu_item,
+            "4": self.menu_statistics,
+        }
+        self._barista_management_dispatch = {
+            "1": self.hire_barista,
+            "2": self.fire_barista,
+        }
+        self._report_dispatch = {
+            "1": self.best_selling_report,
+            "2": self.top_customers_report,
+            "3": self.barista_performance_report,
+            "4": self.show_dashboard,
+        }
     
     def run(self):
         """Uygulamayı çalıştır"""
@@ -45,42 +227,16 @@ class CoffeeShopApp:
     def show_main_menu(self):
         """Ana menü"""
         MenuHelper.clear_screen()
-        print(Formatter.format_header("☕ ANA MENÜ ☕", 60))
-        
-        print("1️⃣  Kafeyi Aç/Kapat")
-        print("2️⃣  Müşteri İşlemleri")
-        print("3️⃣  Sipariş Ver (Müşteri Olarak)")
-        print("4️⃣  Barista Paneli")
-        print("5️⃣  Yönetici Paneli")
-        print("6️⃣  Menüyü Görüntüle")
-        print("7️⃣  Raporlar ve İstatistikler")
-        print("0️⃣  Çıkış")
         
-        print("\n" + "="*60)
-        
-        # Durum bilgisi
+        # Durum bilgisi (sadece bu satır her seferinde yeniden oluşturulur)
         stats = self.manager.get_dashboard_statistics()
         status = "🟢 AÇIK" if stats['is_open'] else "🔴 KAPALI"
-        print(f"\nDurum: {status} | Bekleyen Sipariş: {stats['pending_orders']} | Günlük Gelir: {stats['daily_revenue']:.2f}₺")
+        status_line = f"\nDurum: {status} | Bekleyen Sipariş: {stats['pending_orders']} | Günlük Gelir: {stats['daily_revenue']:.2f}₺\n"
+        MenuHelper.write_frame(_MAIN_MENU_FRAME + status_line.encode("utf-8"))
         
-        choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4, 5, 6, 7])
+        choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_7)
         
-        if choice == "1":
-            self.cafe_operations()
-        elif choice == "2":
-            self.customer_operations()
-        elif choice == "3":
-            self.customer_order_flow()
-        elif choice == "4":
-            self.barista_panel()
-        elif choice == "5":
-            self.admin_panel()
-        elif choice == "6":
-            self.show_menu()
-        elif choice == "7":
-            self.show_reports()
-        elif choice == "0":
-            self.exit_app()
+        self._main_dispatch[choice]()
     
     # ============ KAFE İŞLEMLERİ ============
     
@@ -113,27 +269,13 @@ class CoffeeShopApp:
             MenuHelper.clear_screen()
             print(Formatter.format_header("👥 MÜŞTERİ İŞLEMLERİ", 60))
             
-            print("1. Yeni Müşteri Kaydet")
-            print("2. Müşteri Listesi")
-            print("3. Müşteri Ara")
-            print("4. Müşteri Bakiye Ekle")
-            print("5. Müşteri Sil")
-            print("0. Geri Dön")
+            sys.stdout.write("\n".join(_CUSTOMER_MENU_LINES) + "\n")
             
-            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4, 5])
+            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_5)
             
-            if choice == "1":
-                self.register_customer()
-            elif choice == "2":
-                self.list_customers()
-            elif choice == "3":
-                self.search_customer()
-            elif choice == "4":
-                self.add_customer_balance()
-            elif choice == "5":
-                self.remove_customer()
-            elif choice == "0":
+            if choice == "0":
                 break
+            self._customer_dispatch[choice]()
     
     def register_customer(self):
         """Yeni müşteri kaydet"""
@@ -154,18 +296,10 @@ class CoffeeShopApp:
             "Geçersiz telefon numarası!"
         )
         
-        print("\nMüşteri Tipi:")
-        print("1. Regular (İndirim yok)")
-        print("2. Premium (%10 indirim)")
-        print("3. VIP (%20 indirim)")
+        sys.stdout.write("\n".join(_CUSTOMER_TYPE_LINES) + "\n")
         
-        type_choice = MenuHelper.get_user_choice("Seçim: ", [1, 2, 3])
-        customer_types = {
-            "1": "Regular",
-            "2": "Premium",
-            "3": "VIP"
-        }
-        customer_type = customer_types[type_choice]
+        type_choice = MenuHelper.get_user_choice("Seçim: ", _CHOICES_1_TO_3)
+        customer_type = _CUSTOMER_TYPES[int(type_choice) - 1]
         
         initial_balance = float(MenuHelper.get_user_input(
             "Başlangıç Bakiyesi (₺): ",
@@ -195,18 +329,20 @@ class CoffeeShopApp:
             Formatter.print_warning("Kayıtlı müşteri yok!")
         else:
             headers = ["ID", "Ad", "Tip", "Bakiye", "Puan"]
-            rows = []
             
-            for customer in customers:
-                rows.append([
-                    customer.id,
-                    customer.name,
-                    customer.__class__.__name__.replace("Customer", ""),
-                    f"{customer.balance:.2f}₺",
-                    customer.loyalty_points
-                ])
+            def render(page):
+                rows = []
+                for customer in page:
+                    rows.append([
+                        customer.id,
+                        customer.name,
+                        customer.__class__.__name__.replace("Customer", ""),
+                        f"{customer.balance:.2f}₺",
+                        customer.loyalty_points
+                    ])
+                TablePrinter.print_table(headers, rows)
             
-            TablePrinter.print_table(headers, rows)
+            MenuHelper.paginate(customers, 20, render)
         
         MenuHelper.pause()
     
@@ -221,12 +357,30 @@ class CoffeeShopApp:
         if customer:
             print(f"\n{customer}")
             print(f"Email: {customer.email}")
-            print(f"Sipariş Geçmişi: {len(customer.order_history)} sipariş")
+            print(f"Sipariş Geçmişi: {customer.order_count} sipariş")
+            
+            if customer.order_count > 0 and MenuHelper.confirm_action("\nSiparişleri görüntülemek ister misiniz?"):
+                self.show_customer_orders(customer)
         else:
             Formatter.print_error("Müşteri bulunamadı!")
         
         MenuHelper.pause()
     
+    def show_customer_orders(self, customer, page_size: int = 20):
+        """Müşterinin siparişlerini sayfa sayfa göster"""
+        last_id = 0
+        
+        while True:
+            orders = self.manager.get_orders_for_customer(customer, last_id, page_size)
+            self._print_orders(orders)
+            
+            if len(orders) < page_size:
+                break
+            
+            last_id = orders[-1].id
+            if not MenuHelper.confirm_action("Devamını göster?"):
+                break
+    
     def add_customer_balance(self):
         """Müşteri bakiye ekle"""
         MenuHelper.clear_screen()
@@ -246,7 +400,7 @@ class CoffeeShopApp:
             "Pozitif bir sayı girin!"
         ))
         
-        new_balance = customer.add_balance(amount)
+        new_balance = self.manager.add_customer_balance(customer, amount)
         Formatter.print_success(f"{amount:.2f}₺ eklendi. Yeni bakiye: {new_balance:.2f}₺")
         
         MenuHelper.pause()
@@ -318,25 +472,21 @@ class CoffeeShopApp:
             # Mevcut sepeti göster
             if len(order) > 0:
                 print("Sepetiniz:")
-                print("-"*60)
+                print(THIN_SEPARATOR)
                 for drink, qty in order.items:
                     print(f"  {qty}x {drink.name} ({drink.size}) - {drink.get_final_price() * qty:.2f}₺")
-                print("-"*60)
+                print(THIN_SEPARATOR)
                 print(f"Ara Toplam: {order.calculate_subtotal():.2f}₺")
                 if order.calculate_discount() > 0:
                     print(f"İndirim: -{order.calculate_discount():.2f}₺")
                 print(f"TOPLAM: {order.total_price:.2f}₺")
-                print("="*60 + "\n")
+                print(SEPARATOR + "\n")
             else:
                 print("Sepetiniz boş.\n")
             
-            print("1. Ürün Ekle")
-            print("2. Ürün Çıkar")
-            print("3. Siparişi Tamamla")
-            print("4. Sepeti Temizle")
-            print("0. İptal Et")
+            sys.stdout.write("\n".join(_CART_MENU_LINES) + "\n")
             
-            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4])
+            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_4)
             
             if choice == "1":
                 self.add_item_to_order(order)
@@ -415,15 +565,16 @@ class CoffeeShopApp:
             MenuHelper.pause()
             return False
         
-        MenuHelper.clear_screen()
-        print(order.get_detailed_info())
-        
+        # Bakiye yetmiyorsa detaylı fişi hiç oluşturmadan çık
         if order.customer.balance < order.total_price:
             Formatter.print_error(f"Yetersiz bakiye! Bakiyeniz: {order.customer.balance:.2f}₺")
             MenuHelper.pause()
             return False
         
-        if MenuHelper.confirm_action("Siparişi onaylıyor musunuz?"):
+        MenuHelper.clear_screen()
+        print(order.get_detailed_info())
+        
+        if MenuHelper.confirm_char("Siparişi onaylıyor musunuz?"):
             try:
                 self.manager.submit_order(order)
                 Formatter.print_success("Sipariş başarıyla alındı!")
@@ -449,30 +600,13 @@ class CoffeeShopApp:
             MenuHelper.clear_screen()
             print(Formatter.format_header("👨‍🍳 BARISTA PANELİ", 60))
             
-            print("1. Vardiya Başlat/Bitir")
-            print("2. Bekleyen Siparişler")
-            print("3. Sipariş Al ve Hazırla")
-            print("4. Siparişi Tamamla")
-            print("5. Barista Listesi")
-            print("6. Barista İstatistikleri")
-            print("0. Geri Dön")
+            sys.stdout.write("\n".join(_BARISTA_MENU_LINES) + "\n")
             
-            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4, 5, 6])
+            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_6)
             
-            if choice == "1":
-                self.barista_shift_operations()
-            elif choice == "2":
-                self.show_pending_orders()
-            elif choice == "3":
-                self.barista_take_order()
-            elif choice == "4":
-                self.barista_complete_order()
-            elif choice == "5":
-                self.list_baristas()
-            elif choice == "6":
-                self.barista_statistics()
-            elif choice == "0":
+            if choice == "0":
                 break
+            self._barista_dispatch[choice]()
     
     def barista_shift_operations(self):
         """Vardiya başlat/bitir"""
@@ -497,15 +631,15 @@ class CoffeeShopApp:
             barista = baristas[barista_index]
             
             if barista.is_on_duty:
-                if MenuHelper.confirm_action(f"{barista.name} vardiyasını bitirsin mi?"):
+                if MenuHelper.confirm_char(f"{barista.name} vardiyasını bitirsin mi?"):
                     try:
-                        earnings = barista.end_shift()
+                        earnings = self.manager.end_barista_shift(barista)
                         Formatter.print_success(f"Vardiya bitti! Kazanç: {earnings:.2f}₺")
                     except Exception as e:
                         Formatter.print_error(str(e))
             else:
-                if MenuHelper.confirm_action(f"{barista.name} vardiyaya başlasın mı?"):
-                    barista.start_shift()
+                if MenuHelper.confirm_char(f"{barista.name} vardiyaya başlasın mı?"):
+                    self.manager.start_barista_shift(barista)
                     Formatter.print_success("Vardiya başladı!")
             
         except (IndexError, ValueError):
@@ -523,9 +657,7 @@ class CoffeeShopApp:
         if not pending:
             Formatter.print_success("Bekleyen sipariş yok! ✨")
         else:
-            for order in pending:
-                print(order)
-                print("-"*60)
+            MenuHelper.paginate(pending, 20, self._print_orders)
         
         MenuHelper.pause()
     
@@ -595,7 +727,7 @@ class CoffeeShopApp:
             
             print(order.get_detailed_info())
             
-            if MenuHelper.confirm_action("Siparişi tamamla?"):
+            if MenuHelper.confirm_char("Siparişi tamamla?"):
                 self.manager.complete_order(order.id)
                 Formatter.print_success("Sipariş tamamlandı ve teslim edildi!")
             
@@ -681,27 +813,13 @@ class CoffeeShopApp:
             MenuHelper.clear_screen()
             print(Formatter.format_header("🔧 YÖNETİCİ PANELİ", 60))
             
-            print("1. Menü Yönetimi")
-            print("2. Barista İşe Al/Çıkar")
-            print("3. Tüm Siparişler")
-            print("4. Sipariş İptal Et")
-            print("5. Dashboard")
-            print("0. Geri Dön")
+            sys.stdout.write("\n".join(_ADMIN_MENU_LINES) + "\n")
             
-            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4, 5])
+            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_5)
             
-            if choice == "1":
-                self.menu_management()
-            elif choice == "2":
-                self.barista_management()
-            elif choice == "3":
-                self.show_all_orders()
-            elif choice == "4":
-                self.cancel_order_admin()
-            elif choice == "5":
-                self.show_dashboard()
-            elif choice == "0":
+            if choice == "0":
                 break
+            self._admin_dispatch[choice]()
     
     def menu_management(self):
         """Menü yönetimi"""
@@ -709,24 +827,13 @@ class CoffeeShopApp:
             MenuHelper.clear_screen()
             print(Formatter.format_header("📋 MENÜ YÖNETİMİ", 60))
             
-            print("1. Menüyü Görüntüle")
-            print("2. Ürün Ekle")
-            print("3. Ürün Sil")
-            print("4. Menü İstatistikleri")
-            print("0. Geri Dön")
+            sys.stdout.write("\n".join(_MENU_MANAGEMENT_LINES) + "\n")
             
-            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4])
+            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_4)
             
-            if choice == "1":
-                self.show_menu()
-            elif choice == "2":
-                self.add_menu_item()
-            elif choice == "3":
-                self.remove_menu_item()
-            elif choice == "4":
-                self.menu_statistics()
-            elif choice == "0":
+            if choice == "0":
                 break
+            self._menu_management_dispatch[choice]()
     
     def add_menu_item(self):
         """Menüye ürün ekle"""
@@ -741,28 +848,19 @@ class CoffeeShopApp:
             "Pozitif bir sayı girin!"
         ))
         
-        print("\nKategori:")
-        print("1. Hot")
-        print("2. Cold")
-        print("3. Dessert")
-        print("4. Food")
+        sys.stdout.write("\n".join(_CATEGORY_LINES) + "\n")
         
-        cat_choice = MenuHelper.get_user_choice("Seçim: ", [1, 2, 3, 4])
-        categories = {"1": "Hot", "2": "Cold", "3": "Dessert", "4": "Food"}
-        category = categories[cat_choice]
+        cat_choice = MenuHelper.get_user_choice("Seçim: ", _CHOICES_1_TO_4)
+        category = _CATEGORIES[int(cat_choice) - 1]
         
         print("\nMalzemeler (virgülle ayırın):")
         ingredients_str = input("> ")
         ingredients = [ing.strip() for ing in ingredients_str.split(",")]
         
-        print("\nBoyut:")
-        print("1. Small")
-        print("2. Medium")
-        print("3. Large")
+        sys.stdout.write("\n".join(_SIZE_LINES) + "\n")
         
-        size_choice = MenuHelper.get_user_choice("Seçim: ", [1, 2, 3])
-        sizes = {"1": "Small", "2": "Medium", "3": "Large"}
-        size = sizes[size_choice]
+        size_choice = MenuHelper.get_user_choice("Seçim: ", _CHOICES_1_TO_3)
+        size = _SIZES[int(size_choice) - 1]
         
         try:
             from models.drink import Drink
@@ -837,16 +935,13 @@ class CoffeeShopApp:
         MenuHelper.clear_screen()
         print(Formatter.format_header("👨‍🍳 BARISTA YÖNETİMİ", 60))
         
-        print("1. Barista İşe Al")
-        print("2. Barista İşten Çıkar")
-        print("0. Geri Dön")
+        sys.stdout.write("\n".join(_BARISTA_MANAGEMENT_LINES) + "\n")
         
-        choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2])
+        choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_2)
         
-        if choice == "1":
-            self.hire_barista()
-        elif choice == "2":
-            self.fire_barista()
+        action = self._barista_management_dispatch.get(choice)
+        if action:
+            action()
     
     def hire_barista(self):
         """Barista işe al"""
@@ -925,15 +1020,9 @@ class CoffeeShopApp:
         MenuHelper.clear_screen()
         print(Formatter.format_header("📦 TÜM SİPARİŞLER", 60))
         
-        print("1. Tüm Siparişler")
-        print("2. Bekleyen Siparişler")
-        print("3. Hazırlanan Siparişler")
-        print("4. Hazır Siparişler")
-        print("5. Teslim Edilen Siparişler")
-        print("6. İptal Edilen Siparişler")
-        print("0. Geri Dön")
+        sys.stdout.write("\n".join(_ORDER_FILTER_LINES) + "\n")
         
-        choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4, 5, 6])
+        choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_6)
         
         if choice == "0":
             return
@@ -941,35 +1030,26 @@ class CoffeeShopApp:
         MenuHelper.clear_screen()
         
         if choice == "1":
-            orders = self.manager._CafeManager__orders  # Access private attribute
+            orders = self.manager.all_orders()
             title = "TÜM SİPARİŞLER"
-        elif choice == "2":
-            orders = self.manager.get_orders_by_status(OrderStatus.PENDING)
-            title = "BEKLEYEN SİPARİŞLER"
-        elif choice == "3":
-            orders = self.manager.get_orders_by_status(OrderStatus.PREPARING)
-            title = "HAZIRLANAN SİPARİŞLER"
-        elif choice == "4":
-            orders = self.manager.get_orders_by_status(OrderStatus.READY)
-            title = "HAZIR SİPARİŞLER"
-        elif choice == "5":
-            orders = self.manager.get_orders_by_status(OrderStatus.DELIVERED)
-            title = "TESLİM EDİLEN SİPARİŞLER"
-        elif choice == "6":
-            orders = self.manager.get_orders_by_status(OrderStatus.CANCELLED)
-            title = "İPTAL EDİLEN SİPARİŞLER"
+        else:
+            status, title = _ORDER_FILTERS[choice]
+            orders = self.manager.get_orders_by_status(status)
         
         print(Formatter.format_header(f"📦 {title}", 60))
         
         if not orders:
             Formatter.print_warning("Sipariş yok!")
         else:
-            for order in orders:
-                print(order)
-                print("-"*60)
+            MenuHelper.paginate(orders, 20, self._print_orders)
         
         MenuHelper.pause()
     
+    @staticmethod
+    def _print_orders(orders):
+        """Sipariş listesini ayraçlarla yazdır (sayfa başına tek write)"""
+        sys.stdout.write("".join(f"{order}\n{THIN_SEPARATOR}\n" for order in orders))
+    
     def cancel_order_admin(self):
         """Sipariş iptal et (admin)"""
         MenuHelper.clear_screen()
@@ -996,28 +1076,26 @@ class CoffeeShopApp:
         
         stats = self.manager.get_dashboard_statistics()
         
-        print(f"☕ Kafe: {stats['cafe_name']}")
-        print(f"Durum: {'🟢 AÇIK' if stats['is_open'] else '🔴 KAPALI'}")
-        print("\n" + "="*60 + "\n")
-        
-        print("👥 Müşteriler:")
-        print(f"   Toplam: {stats['total_customers']}")
-        
-        print("\n👨‍🍳 Barista'lar:")
-        print(f"   Toplam: {stats['total_baristas']}")
-        print(f"   Müsait: {stats['available_baristas']}")
-        
-        print("\n📦 Siparişler:")
-        print(f"   Bekleyen: {stats['pending_orders']}")
-        print(f"   Toplam: {stats['total_orders']}")
-        print(f"   Bugün Tamamlanan: {stats['completed_today']}")
-        
-        print("\n💰 Gelir:")
-        print(f"   Günlük: {stats['daily_revenue']:.2f}₺")
-        print(f"   Toplam: {stats['total_revenue']:.2f}₺")
-        
-        print("\n📋 Menü:")
-        print(f"   Ürün Sayısı: {stats['menu_items']}")
+        # Tüm ekran tek seferde yazılır
+        print("\n".join((
+            f"☕ Kafe: {stats['cafe_name']}",
+            f"Durum: {'🟢 AÇIK' if stats['is_open'] else '🔴 KAPALI'}",
+            "\n" + SEPARATOR + "\n",
+            "👥 Müşteriler:",
+            f"   Toplam: {stats['total_customers']}",
+            "\n👨‍🍳 Barista'lar:",
+            f"   Toplam: {stats['total_baristas']}",
+            f"   Müsait: {stats['available_baristas']}",
+            "\n📦 Siparişler:",
+            f"   Bekleyen: {stats['pending_orders']}",
+            f"   Toplam: {stats['total_orders']}",
+            f"   Bugün Tamamlanan: {stats['completed_today']}",
+            "\n💰 Gelir:",
+            f"   Günlük: {stats['daily_revenue']:.2f}₺",
+            f"   Toplam: {stats['total_revenue']:.2f}₺",
+            "\n📋 Menü:",
+            f"   Ürün Sayısı: {stats['menu_items']}"
+        )))
         
         MenuHelper.pause()
     
@@ -1035,24 +1113,13 @@ class CoffeeShopApp:
             MenuHelper.clear_screen()
             print(Formatter.format_header("📊 RAPORLAR VE İSTATİSTİKLER", 60))
             
-            print("1. En Çok Satan Ürünler")
-            print("2. En Çok Harcayan Müşteriler")
-            print("3. Barista Performans Raporu")
-            print("4. Dashboard")
-            print("0. Geri Dön")
+            sys.stdout.write("\n".join(_REPORT_MENU_LINES) + "\n")
             
-            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", [0, 1, 2, 3, 4])
+            choice = MenuHelper.get_user_choice("\nSeçiminiz: ", _CHOICES_0_TO_4)
             
-            if choice == "1":
-                self.best_selling_report()
-            elif choice == "2":
-                self.top_customers_report()
-            elif choice == "3":
-                self.barista_performance_report()
-            elif choice == "4":
-                self.show_dashboard()
-            elif choice == "0":
+            if choice == "0":
                 break
+            self._report_dispatch[choice]()
     
     def best_selling_report(self):
         """En çok satan ürünler raporu"""
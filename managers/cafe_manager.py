@@ -1,45 +1,80 @@
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Iterable, Optional, Tuple
+from datetime import datetime
+import heapq
 import json
 import os
-from models.drink import Drink
+try:
+    import orjson  # Varsa hızlı JSON kütüphanesi, yoksa standart json kullanılır
+except ImportError:
+    orjson = None
 from models.customer import Customer, RegularCustomer, PremiumCustomer, VIPCustomer
 from models.order import Order, OrderStatus
 from models.barista import Barista
 from models.menu import Menu
+from utils.helpers import SEPARATOR
+
+DATA_FILE = "data/cafe_data.json"
+
+# Kayıttaki müşteri tipi -> sınıf (bilinmeyen tipler Regular yüklenir)
+CUSTOMER_FACTORY = {
+    "RegularCustomer": RegularCustomer,
+    "PremiumCustomer": PremiumCustomer,
+    "VIPCustomer": VIPCustomer
+}
+
+
+def _json_dumps(data: Dict) -> bytes:
+    """Veriyi girintili UTF-8 JSON olarak serileştir"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Dict:
+    """UTF-8 JSON verisini ayrıştır"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class CafeManager:
-    """Kahve dükkanını yöneten ana sınıf (Singleton pattern)"""
-    
-    _instance = None
-    
-    def __new__(cls, cafe_name: str = "Coffee Heaven"):
-        """Singleton pattern - tek instance"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    """Kahve dükkanını yöneten ana sınıf (uygulama içinde get_cafe_manager ile alınır)"""
+    
+    # Sabit özellik listesi: instance __dict__ tutmaz, özellik erişimi hızlanır
+    __slots__ = (
+        "__cafe_name", "__menu",
+        "__customers", "__customers_by_email", "__customers_by_name",
+        "__baristas", "__baristas_by_email", "__available_baristas",
+        "__orders_by_id", "__orders_by_status", "__drink_sales",
+        "__pending_orders", "__pending_heap",
+        "__daily_revenue", "__total_revenue", "__opening_time", "__is_open",
+        "__dashboard_cache", "__dirty"
+    )
     
     def __init__(self, cafe_name: str = "Coffee Heaven"):
-        """Initialize sadece bir kez çalışır"""
-        if self._initialized:
-            return
-        
         self.__cafe_name = cafe_name
         self.__menu = Menu()
         self.__customers = []  # Tüm müşteriler
+        self.__customers_by_email = {}  # Email -> Customer (hızlı arama)
+        self.__customers_by_name = {}  # İsim (küçük harf) -> ilk kayıtlı Customer
         self.__baristas = []  # Tüm barista'lar
-        self.__orders = []  # Tüm siparişler
-        self.__pending_orders = []  # Bekleyen siparişler (kuyruk)
+        self.__baristas_by_email = {}  # Email -> Barista (hızlı arama)
+        self.__available_baristas = []  # Vardiyada ve boşta olan barista'lar
+        self.__orders_by_id = {}  # Sipariş ID -> Order (tüm siparişler, geliş sırasıyla)
+        self.__orders_by_status = {status: {} for status in OrderStatus}  # Durum -> {ID: Order} (geliş sırasıyla)
+        self.__drink_sales = {}  # İçecek adı -> teslim edilen adet/gelir (sürekli güncellenir)
+        self.__pending_orders = self.__orders_by_status[OrderStatus.PENDING]  # Bekleyen siparişler (FIFO, O(1) silme)
+        self.__pending_heap = []  # (-öncelik, sipariş id, sipariş) - otomatik atama sırası
         self.__daily_revenue = 0.0
         self.__total_revenue = 0.0
         self.__opening_time = None
         self.__is_open = False
+        self.__dashboard_cache = None  # Dashboard istatistikleri (değişiklikte sıfırlanır)
+        self.__dirty = False  # Son kayıttan beri değişiklik var mı
         
         # Başlangıç verilerini yükle
         self._load_data()
-        
-        self._initialized = True
+        self.__dirty = False
     
     # Properties
     @property
@@ -71,11 +106,12 @@ class CafeManager:
         self.__is_open = True
         self.__opening_time = datetime.now()
         self.__daily_revenue = 0.0
+        self._invalidate_stats()
         
-        print(f"\n{'='*60}")
+        print(f"\n{SEPARATOR}")
         print(f"☕ {self.__cafe_name} AÇILDI! ☕".center(60))
         print(f"Açılış Saati: {self.__opening_time.strftime('%H:%M:%S')}")
-        print(f"{'='*60}\n")
+        print(f"{SEPARATOR}\n")
         
         return True
     
@@ -91,11 +127,12 @@ class CafeManager:
         # Vardiyada olan barista'ları kapat
         for barista in self.__baristas:
             if barista.is_on_duty:
-                earnings = barista.end_shift()
+                earnings = self.end_barista_shift(barista)
                 print(f"✅ {barista.name} vardiyasını bitirdi. Kazanç: {earnings:.2f}₺")
         
         self.__is_open = False
         self.__total_revenue += self.__daily_revenue
+        self._invalidate_stats()
         
         # Günlük rapor
         self._print_daily_report()
@@ -123,34 +160,63 @@ class CafeManager:
         else:
             raise ValueError("Geçersiz müşteri tipi! (Regular/Premium/VIP)")
         
-        self.__customers.append(customer)
+        self._add_customer(customer)
         print(f"✅ {customer_type} müşteri kaydedildi: {name}")
         
         return customer
     
+    def _add_customer(self, customer: Customer):
+        """Müşteriyi listeye ve email/isim indekslerine ekle"""
+        self.__customers.append(customer)
+        self.__customers_by_email[customer.email_key] = customer
+        self.__customers_by_name.setdefault(customer.name_key, customer)
+        self._invalidate_stats()
+        self._mark_dirty()
+    
+    def _bulk_load_customers(self, customers: List[Customer]):
+        """Kayıttan okunan müşterileri tek seferde listeye ve indekslere ekle"""
+        self.__customers.extend(customers)
+        self.__customers_by_email.update({c.email_key: c for c in customers})
+        for customer in customers:
+            self.__customers_by_name.setdefault(customer.name_key, customer)
+        self._invalidate_stats()
+    
     def get_customer_by_email(self, email: str) -> Optional[Customer]:
-        """Email'e göre müşteri bul"""
-        for customer in self.__customers:
-            if customer.email.lower() == email.lower():
-                return customer
-        return None
+        """Email'e göre müşteri bul (O(1) sözlük araması)"""
+        return self.__customers_by_email.get(email.strip().lower())
     
     def get_customer_by_name(self, name: str) -> Optional[Customer]:
         """İsme göre müşteri bul"""
-        for customer in self.__customers:
-            if customer.name.lower() == name.lower():
-                return customer
-        return None
+        return self.__customers_by_name.get(name.lower())
+    
+    def get_all_customers(self) -> Tuple[Customer, ...]:
+        """Tüm müşterileri getir (değiştirilemez anlık görüntü)"""
+        return tuple(self.__customers)
     
-    def get_all_customers(self) -> List[Customer]:
-        """Tüm müşterileri getir"""
-        return self.__customers.copy()
+    def add_customer_balance(self, customer: Customer, amount: float) -> float:
+        """Müşteriye bakiye ekle (kaydedilecek değişiklik olarak işaretlenir)"""
+        new_balance = customer.add_balance(amount)
+        self._mark_dirty()
+        return new_balance
     
     def remove_customer(self, email: str) -> bool:
         """Müşteri sil"""
         customer = self.get_customer_by_email(email)
         if customer:
             self.__customers.remove(customer)
+            self.__customers_by_email.pop(customer.email_key, None)
+            
+            # Aynı isimde başka müşteri varsa isim indeksi ona geçer
+            name_key = customer.name_key
+            if self.__customers_by_name.get(name_key) is customer:
+                del self.__customers_by_name[name_key]
+                for other in self.__customers:
+                    if other.name_key == name_key:
+                        self.__customers_by_name[name_key] = other
+                        break
+            
+            self._invalidate_stats()
+            self._mark_dirty()
             return True
         return False
     
@@ -159,42 +225,70 @@ class CafeManager:
                     hourly_rate: float = 50.0) -> Barista:
         """Yeni barista işe al"""
         # Email kontrolü
-        for barista in self.__baristas:
-            if barista.email.lower() == email.lower():
-                raise ValueError(f"{email} zaten kayıtlı!")
+        if self.get_barista_by_email(email):
+            raise ValueError(f"{email} zaten kayıtlı!")
         
         barista = Barista(name, email, experience_years, hourly_rate)
-        self.__baristas.append(barista)
+        self._add_barista(barista)
         
         print(f"✅ Barista işe alındı: {name} ({experience_years} yıl tecrübe)")
         
         return barista
     
+    def _add_barista(self, barista: Barista):
+        """Barista'yı listeye ve email indeksine ekle"""
+        self.__baristas.append(barista)
+        self.__baristas_by_email[barista.email_key] = barista
+        self._invalidate_stats()
+        self._mark_dirty()
+    
+    def _bulk_load_baristas(self, baristas: List[Barista]):
+        """Kayıttan okunan barista'ları tek seferde listeye ve indekse ekle"""
+        self.__baristas.extend(baristas)
+        self.__baristas_by_email.update({b.email_key: b for b in baristas})
+        self._invalidate_stats()
+    
     def fire_barista(self, email: str) -> bool:
         """Barista'yı işten çıkar"""
-        for barista in self.__baristas:
-            if barista.email.lower() == email.lower():
-                if barista.is_on_duty:
-                    raise ValueError(f"{barista.name} vardiyada! Önce vardiyayı bitirin.")
-                
-                self.__baristas.remove(barista)
-                return True
+        barista = self.get_barista_by_email(email)
+        if barista:
+            if barista.is_on_duty:
+                raise ValueError(f"{barista.name} vardiyada! Önce vardiyayı bitirin.")
+            
+            self.__baristas.remove(barista)
+            del self.__baristas_by_email[barista.email_key]
+            self._invalidate_stats()
+            self._mark_dirty()
+            return True
         return False
     
     def get_barista_by_email(self, email: str) -> Optional[Barista]:
-        """Email'e göre barista bul"""
-        for barista in self.__baristas:
-            if barista.email.lower() == email.lower():
-                return barista
-        return None
+        """Email'e göre barista bul (O(1) sözlük araması)"""
+        return self.__baristas_by_email.get(email.strip().lower())
+    
+    def start_barista_shift(self, barista: Barista) -> bool:
+        """Barista'nın vardiyasını başlat"""
+        barista.start_shift()
+        self.__available_baristas.append(barista)
+        self._invalidate_stats()
+        self._mark_dirty()
+        return True
     
-    def get_available_baristas(self) -> List[Barista]:
-        """Müsait barista'ları getir"""
-        return [b for b in self.__baristas if b.is_available]
+    def end_barista_shift(self, barista: Barista) -> float:
+        """Barista'nın vardiyasını bitir, kazancı döndür"""
+        earnings = barista.end_shift()
+        self.__available_baristas.remove(barista)
+        self._invalidate_stats()
+        self._mark_dirty()
+        return earnings
     
-    def get_all_baristas(self) -> List[Barista]:
-        """Tüm barista'ları getir"""
-        return self.__baristas.copy()
+    def get_available_baristas(self) -> Tuple[Barista, ...]:
+        """Müsait barista'ları getir (değiştirilemez anlık görüntü)"""
+        return tuple(self.__available_baristas)
+    
+    def get_all_baristas(self) -> Tuple[Barista, ...]:
+        """Tüm barista'ları getir (değiştirilemez anlık görüntü)"""
+        return tuple(self.__baristas)
     
     # Sipariş yönetimi
     def create_order(self, customer: Customer) -> Order:
@@ -218,8 +312,12 @@ class CafeManager:
             raise ValueError("Ödeme başarısız!")
         
         # Siparişleri kaydet
-        self.__orders.append(order)
-        self.__pending_orders.append(order)
+        self.__orders_by_id[order.id] = order
+        self.__orders_by_status[order.status][order.id] = order
+        heapq.heappush(self.__pending_heap, (-self._order_priority(order), order.id, order))
+        order.customer.add_to_history(order)
+        self._invalidate_stats()
+        self._mark_dirty()
         
         print(f"\n✅ Sipariş #{order.id} alındı!")
         print(f"Müşteri: {order.customer.name}")
@@ -230,14 +328,15 @@ class CafeManager:
     
     def assign_order_to_barista(self, order: Order, barista: Barista) -> bool:
         """Siparişi barista'ya ata"""
-        if order not in self.__pending_orders:
+        if self.__pending_orders.get(order.id) is not order:
             raise ValueError("Bu sipariş bekleyen siparişlerde değil!")
         
         if not barista.is_available:
             raise ValueError(f"{barista.name} müsait değil!")
         
         barista.take_order(order)
-        self.__pending_orders.remove(order)
+        self.__available_baristas.remove(barista)
+        self._move_order(order, OrderStatus.PENDING)
         
         print(f"✅ Sipariş #{order.id}, {barista.name}'e atandı!")
         
@@ -253,16 +352,29 @@ class CafeManager:
         
         assigned_count = 0
         for barista in available_baristas:
-            if not self.__pending_orders:
+            order = self._pop_next_pending_order()
+            if order is None:
                 break
             
-            order = self.__pending_orders[0]
             self.assign_order_to_barista(order, barista)
             assigned_count += 1
         
         if assigned_count > 0:
             print(f"✅ {assigned_count} sipariş otomatik atandı!")
     
+    @staticmethod
+    def _order_priority(order: Order) -> int:
+        """Öncelikli servis alan müşterilerin siparişleri önce atanır"""
+        return 1 if getattr(order.customer, "has_priority", False) else 0
+    
+    def _pop_next_pending_order(self) -> Optional[Order]:
+        """Sıradaki bekleyen siparişi heap'ten al (atanmış/iptal edilmişleri atla)"""
+        while self.__pending_heap:
+            order = heapq.heappop(self.__pending_heap)[2]
+            if order.status is OrderStatus.PENDING:
+                return order
+        return None
+    
     def complete_order(self, order_id: int) -> bool:
         """Siparişi tamamla"""
         order = self.get_order_by_id(order_id)
@@ -273,18 +385,28 @@ class CafeManager:
         if not order.barista:
             raise ValueError("Bu siparişin barista'sı yok!")
         
-        # Barista siparişi tamamlar
+        old_status = order.status
+        
+        # Barista siparişi tamamlar ve tekrar müsait olur
         order.barista.complete_order()
+        if order.barista.is_available:
+            self.__available_baristas.append(order.barista)
         
         # Siparişi teslim et
         order.mark_as_delivered()
+        self._move_order(order, old_status)
         
-        # Geliri ekle
-        self.__daily_revenue += order.total_price
+        # Geliri ve satış özetlerini güncelle
+        total = order.total_price
+        self.__daily_revenue += total
+        order.customer.add_spending(total)
+        self._record_drink_sales(order)
+        self._invalidate_stats()
+        self._mark_dirty()
         
         print(f"✅ Sipariş #{order.id} tamamlandı ve teslim edildi!")
         print(f"Müşteri: {order.customer.name}")
-        print(f"Kazanılan puan: +{int(order.total_price / 10)}")
+        print(f"Kazanılan puan: +{int(total / 10)}")
         
         return True
     
@@ -295,133 +417,151 @@ class CafeManager:
         if not order:
             raise ValueError(f"Sipariş #{order_id} bulunamadı!")
         
+        old_status = order.status
         order.cancel()
         
         # Müşteriye para iade et
         order.customer.add_balance(order.total_price)
+        self._mark_dirty()
         
-        # Bekleyen siparişlerden çıkar
-        if order in self.__pending_orders:
-            self.__pending_orders.remove(order)
+        # Eski durum listesinden çıkar (bekleyenler dahil)
+        self._move_order(order, old_status)
         
         print(f"✅ Sipariş #{order.id} iptal edildi. Para iade edildi.")
         
         return True
     
+    def _move_order(self, order: Order, old_status: OrderStatus):
+        """Durum değişikliğinden sonra siparişi doğru listeye taşı"""
+        del self.__orders_by_status[old_status][order.id]
+        self.__orders_by_status[order.status][order.id] = order
+        self._invalidate_stats()
+    
     def get_order_by_id(self, order_id: int) -> Optional[Order]:
         """ID'ye göre sipariş bul"""
-        for order in self.__orders:
-            if order.id == order_id:
-                return order
-        return None
+        return self.__orders_by_id.get(order_id)
     
-    def get_pending_orders(self) -> List[Order]:
-        """Bekleyen siparişleri getir"""
-        return self.__pending_orders.copy()
+    def all_orders(self) -> Iterable[Order]:
+        """Tüm siparişleri kopyalamadan, salt okunur görünüm olarak getir"""
+        return self.__orders_by_id.values()
     
-    def get_orders_by_status(self, status: OrderStatus) -> List[Order]:
-        """Duruma göre siparişleri filtrele"""
-        return [order for order in self.__orders if order.status == status]
+    def get_pending_orders(self) -> Tuple[Order, ...]:
+        """Bekleyen siparişleri geliş sırasıyla getir"""
+        return tuple(self.__pending_orders.values())
+    
+    def get_orders_by_status(self, status: OrderStatus) -> Tuple[Order, ...]:
+        """Duruma göre siparişleri getir"""
+        return tuple(self.__orders_by_status[status].values())
     
     def get_customer_orders(self, customer: Customer) -> List[Order]:
         """Müşterinin siparişlerini getir"""
-        return [order for order in self.__orders if order.customer == customer]
+        return [order for order in self.__orders_by_id.values() if order.customer is customer]
+    
+    def get_orders_for_customer(self, customer: Customer, after_id: int = 0,
+                                limit: int = 20) -> List[Order]:
+        """Müşterinin siparişlerini ID sırasıyla, after_id'den sonrasını getir"""
+        # Ara liste oluşturmadan sadece ilk 'limit' sipariş tutulur
+        orders = (order for order in self.__orders_by_id.values()
+                  if order.customer is customer and order.id > after_id)
+        return heapq.nsmallest(limit, orders, key=lambda o: o.id)
     
     # İstatistikler ve raporlar
     def get_dashboard_statistics(self) -> Dict:
-        """Dashboard istatistikleri"""
-        today_orders = [o for o in self.__orders 
-                       if o.status == OrderStatus.DELIVERED]
+        """Dashboard istatistikleri (bir sonraki değişikliğe kadar önbellekte)"""
+        if self.__dashboard_cache is None:
+            today_orders = self.__orders_by_status[OrderStatus.DELIVERED]
+            
+            self.__dashboard_cache = {
+                "cafe_name": self.__cafe_name,
+                "is_open": self.__is_open,
+                "total_customers": len(self.__customers),
+                "total_baristas": len(self.__baristas),
+                "available_baristas": len(self.__available_baristas),
+                "pending_orders": len(self.__pending_orders),
+                "total_orders": len(self.__orders_by_id),
+                "completed_today": len(today_orders),
+                "daily_revenue": self.__daily_revenue,
+                "total_revenue": self.__total_revenue
+            }
         
-        return {
-            "cafe_name": self.__cafe_name,
-            "is_open": self.__is_open,
-            "total_customers": len(self.__customers),
-            "total_baristas": len(self.__baristas),
-            "available_baristas": len(self.get_available_baristas()),
-            "pending_orders": len(self.__pending_orders),
-            "total_orders": len(self.__orders),
-            "completed_today": len(today_orders),
-            "daily_revenue": self.__daily_revenue,
-            "total_revenue": self.__total_revenue,
-            "menu_items": len(self.__menu)
-        }
+        stats = self.__dashboard_cache.copy()
+        # Menü manager dışından değiştirilebildiği için canlı okunur
+        stats["menu_items"] = len(self.__menu)
+        return stats
+    
+    def _invalidate_stats(self):
+        """Dashboard önbelleğini sıfırla"""
+        self.__dashboard_cache = None
+    
+    def _mark_dirty(self):
+        """Kaydedilen veri değişti: kafe kapanırken dosyaya yazılsın"""
+        self.__dirty = True
+    
+    def _record_drink_sales(self, order: Order):
+        """Teslim edilen siparişin ürünlerini satış özetine ekle"""
+        for drink, quantity in order.items:
+            entry = self.__drink_sales.setdefault(drink.name, {"name": drink.name, "quantity": 0, "revenue": 0.0})
+            entry["quantity"] += quantity
+            entry["revenue"] += drink.get_final_price() * quantity
     
     def get_best_selling_drinks(self, limit: int = 5) -> List[Dict]:
         """En çok satan içecekler"""
-        drink_sales = {}
-        
-        for order in self.__orders:
-            if order.status == OrderStatus.DELIVERED:
-                for drink, quantity in order.items:
-                    key = drink.name
-                    if key not in drink_sales:
-                        drink_sales[key] = {"name": drink.name, "quantity": 0, "revenue": 0.0}
-                    
-                    drink_sales[key]["quantity"] += quantity
-                    drink_sales[key]["revenue"] += drink.get_final_price() * quantity
-        
-        # Satış miktarına göre sırala
-        sorted_drinks = sorted(drink_sales.values(), key=lambda x: x["quantity"], reverse=True)
-        
-        return sorted_drinks[:limit]
+        # Satış miktarına göre ilk 'limit' kadarı (tam sıralama yapmadan)
+        best_selling = heapq.nlargest(limit, self.__drink_sales.values(), key=lambda x: x["quantity"])
+        return [drink.copy() for drink in best_selling]
     
     def get_top_customers(self, limit: int = 5) -> List[Dict]:
         """En çok harcayan müşteriler"""
-        customer_spending = {}
+        top_customers = heapq.nlargest(limit, self.__customers, key=lambda c: c.total_spent)
         
-        for customer in self.__customers:
-            total = sum(order.total_price for order in self.__orders 
-                       if order.customer == customer and order.status == OrderStatus.DELIVERED)
-            
-            customer_spending[customer.name] = {
+        return [
+            {
                 "name": customer.name,
                 "type": customer.__class__.__name__,
-                "total_spent": total,
-                "order_count": len([o for o in self.__orders if o.customer == customer]),
+                "total_spent": customer.total_spent,
+                "order_count": customer.order_count,
                 "loyalty_points": customer.loyalty_points
             }
-        
-        sorted_customers = sorted(customer_spending.values(), 
-                                 key=lambda x: x["total_spent"], reverse=True)
-        
-        return sorted_customers[:limit]
+            for customer in top_customers
+        ]
     
     def _print_daily_report(self):
-        """Günlük rapor yazdır"""
-        print("\n" + "="*60)
-        print("📊 GÜNLÜK RAPOR 📊".center(60))
-        print("="*60)
-        
+        """Günlük rapor yazdır (satırlar biriktirilip tek seferde basılır)"""
         stats = self.get_dashboard_statistics()
         
-        print(f"\n💰 Gelir:")
-        print(f"   Bugünkü Gelir: {self.__daily_revenue:.2f}₺")
-        print(f"   Toplam Gelir: {self.__total_revenue:.2f}₺")
-        
-        print(f"\n📦 Siparişler:")
-        print(f"   Tamamlanan: {stats['completed_today']}")
-        print(f"   Bekleyen: {stats['pending_orders']}")
-        print(f"   Toplam: {stats['total_orders']}")
-        
-        print(f"\n👥 Müşteriler:")
-        print(f"   Toplam Müşteri: {stats['total_customers']}")
-        
-        print(f"\n👨‍🍳 Barista'lar:")
-        print(f"   Toplam: {stats['total_baristas']}")
+        lines = [
+            "\n" + SEPARATOR,
+            "📊 GÜNLÜK RAPOR 📊".center(60),
+            SEPARATOR,
+            "\n💰 Gelir:",
+            f"   Bugünkü Gelir: {self.__daily_revenue:.2f}₺",
+            f"   Toplam Gelir: {self.__total_revenue:.2f}₺",
+            "\n📦 Siparişler:",
+            f"   Tamamlanan: {stats['completed_today']}",
+            f"   Bekleyen: {stats['pending_orders']}",
+            f"   Toplam: {stats['total_orders']}",
+            "\n👥 Müşteriler:",
+            f"   Toplam Müşteri: {stats['total_customers']}",
+            "\n👨‍🍳 Barista'lar:",
+            f"   Toplam: {stats['total_baristas']}"
+        ]
         
         # En çok satanlar
         best_selling = self.get_best_selling_drinks(3)
         if best_selling:
-            print(f"\n🏆 En Çok Satanlar:")
+            lines.append("\n🏆 En Çok Satanlar:")
             for i, drink in enumerate(best_selling, 1):
-                print(f"   {i}. {drink['name']}: {drink['quantity']} adet ({drink['revenue']:.2f}₺)")
+                lines.append(f"   {i}. {drink['name']}: {drink['quantity']} adet ({drink['revenue']:.2f}₺)")
         
-        print("\n" + "="*60 + "\n")
+        lines.append("\n" + SEPARATOR + "\n")
+        print("\n".join(lines))
     
     # Veri kalıcılığı
     def _save_data(self):
-        """Verileri JSON'a kaydet"""
+        """Verileri JSON'a kaydet (değişiklik yoksa yazmaz)"""
+        if not self.__dirty:
+            return
+        
         data = {
             "cafe_name": self.__cafe_name,
             "total_revenue": self.__total_revenue,
@@ -431,62 +571,42 @@ class CafeManager:
         }
         
         try:
-            with open("data/cafe_data.json", "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Önce geçici dosyaya yaz, sonra tek adımda değiştir (yarım dosya kalmaz)
+            with open(DATA_FILE + ".tmp", "wb") as f:
+                f.write(_json_dumps(data))
+            os.replace(DATA_FILE + ".tmp", DATA_FILE)
             print("💾 Veriler kaydedildi!")
         except Exception as e:
             print(f"⚠️  Veri kaydetme hatası: {e}")
+            return
+        
+        self.__dirty = False
     
     def _load_data(self):
         """JSON'dan verileri yükle"""
-        if not os.path.exists("data/cafe_data.json"):
+        if not os.path.exists(DATA_FILE):
             print("📝 İlk çalıştırma, varsayılan veriler yükleniyor...")
             self._initialize_default_data()
             return
         
         try:
-            with open("data/cafe_data.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(DATA_FILE, "rb") as f:
+                data = _json_loads(f.read())
             
             self.__cafe_name = data.get("cafe_name", "Coffee Heaven")
             self.__total_revenue = data.get("total_revenue", 0.0)
             
             # Müşterileri yükle
-            for customer_data in data.get("customers", []):
-                customer_type = customer_data.get("type", "RegularCustomer")
-                if customer_type == "PremiumCustomer":
-                    customer = PremiumCustomer(
-                        customer_data["name"],
-                        customer_data["email"],
-                        customer_data["phone"],
-                        customer_data["balance"]
-                    )
-                elif customer_type == "VIPCustomer":
-                    customer = VIPCustomer(
-                        customer_data["name"],
-                        customer_data["email"],
-                        customer_data["phone"],
-                        customer_data["balance"]
-                    )
-                else:
-                    customer = RegularCustomer(
-                        customer_data["name"],
-                        customer_data["email"],
-                        customer_data["phone"],
-                        customer_data["balance"]
-                    )
-                
-                self.__customers.append(customer)
+            self._bulk_load_customers([
+                CUSTOMER_FACTORY.get(customer_data.get("type"), RegularCustomer).from_dict(customer_data)
+                for customer_data in data.get("customers", [])
+            ])
             
             # Barista'ları yükle
-            for barista_data in data.get("baristas", []):
-                barista = Barista(
-                    barista_data["name"],
-                    barista_data["email"],
-                    barista_data["experience_years"],
-                    barista_data["hourly_rate"]
-                )
-                self.__baristas.append(barista)
+            self._bulk_load_baristas([
+                Barista.from_dict(barista_data)
+                for barista_data in data.get("baristas", [])
+            ])
             
             print("✅ Veriler yüklendi!")
             
@@ -511,4 +631,15 @@ class CafeManager:
         return f"{self.__cafe_name} - {status} - {len(self.__customers)} müşteri, {len(self.__baristas)} barista"
     
     def __repr__(self) -> str:
-        return f"CafeManager(name='{self.__cafe_name}', open={self.__is_open})"
\ No newline at end of file
+        return f"CafeManager(name='{self.__cafe_name}', open={self.__is_open})"
+
+
+_cafe_manager: Optional[CafeManager] = None
+
+
+def get_cafe_manager(cafe_name: str = "Coffee Heaven") -> CafeManager:
+    """Uygulamanın tek CafeManager'ını getir (ilk çağrıda oluşturulur)"""
+    global _cafe_manager
+    if _cafe_manager is None:
+        _cafe_manager = CafeManager(cafe_name)
+    return _cafe_manager
@@ -1,10 +1,17 @@
 from typing import List, Dict
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from models.order import OrderStatus
 
 class Barista:
     """Barista (çalışan) sınıfı"""
     
     _id_counter = 1
+    # (en az tecrübe yılı, bonus katsayısı) - büyükten küçüğe: %50, %30, %10
+    _BONUS_TIERS = ((5, 1.5), (3, 1.3), (1, 1.1))
+    
+    __slots__ = ("__id", "__name", "__email", "__email_key", "__experience_years", "__hourly_rate",
+                 "__orders_completed", "__completed_dates", "__current_order", "__total_earnings",
+                 "__shift_start", "__shift_end", "__is_on_duty", "__performance_rating")
     
     def __init__(self, name: str, email: str, experience_years: int = 0, hourly_rate: float = 50.0):
         """
@@ -19,9 +26,11 @@ class Barista:
         
         self.__name = name
         self.__email = email
+        self.__email_key = email.strip().lower()  # Email indeksi anahtarı (bir kez hesaplanır)
         self.__experience_years = experience_years
         self.__hourly_rate = hourly_rate
         self.__orders_completed = []  # Tamamlanan siparişler
+        self.__completed_dates = []  # Aynı sırada tamamlanma tarihleri (bugün filtresi için)
         self.__current_order = None  # Şu an hazırladığı sipariş
         self.__total_earnings = 0.0
         self.__shift_start = None
@@ -42,6 +51,10 @@ class Barista:
     def email(self) -> str:
         return self.__email
     
+    @property
+    def email_key(self) -> str:
+        return self.__email_key
+    
     @property
     def experience_years(self) -> int:
         return self.__experience_years
@@ -122,7 +135,7 @@ class Barista:
         if self.__current_order:
             raise ValueError(f"{self.__name} zaten bir sipariş hazırlıyor!")
         
-        if order.status.value != "Beklemede":
+        if order.status is not OrderStatus.PENDING:
             raise ValueError("Bu sipariş hazırlanamaz!")
         
         self.__current_order = order
@@ -137,13 +150,15 @@ class Barista:
         # Siparişi hazır olarak işaretle
         self.__current_order.mark_as_ready()
         
-        # Tamamlanan siparişlere ekle
+        # Tamamlanan siparişlere ekle (siparişin hazır olma zamanı tekrar kullanılır)
+        completed_at = self.__current_order.prepared_at
         self.__orders_completed.append({
             "order_id": self.__current_order.id,
             "customer": self.__current_order.customer.name,
-            "completed_at": datetime.now().isoformat(),
+            "completed_at": completed_at.isoformat(),
             "total": self.__current_order.total_price
         })
+        self.__completed_dates.append(completed_at.date())
         
         # Mevcut siparişi temizle
         self.__current_order = None
@@ -177,38 +192,32 @@ class Barista:
     # İstatistikler
     def get_statistics(self) -> Dict:
         """Barista istatistikleri"""
+        # Sipariş sayısı ve vardiya süresi bir kez hesaplanıp tekrar kullanılır
+        total_orders = len(self.__orders_completed)
+        shift_hours = self.get_shift_hours()
+        
         return {
-            "total_orders": self.total_orders_completed,
+            "total_orders": total_orders,
             "total_earnings": self.__total_earnings,
-            "efficiency": self.calculate_efficiency(),
+            "efficiency": total_orders / shift_hours if shift_hours else 0.0,
             "performance_rating": self.__performance_rating,
             "experience_years": self.__experience_years,
             "current_status": "Vardiyada" if self.__is_on_duty else "Vardiya Dışı",
-            "availability": "Müsait" if self.is_available else "Meşgul"
+            "availability": "Müsait" if self.__is_on_duty and self.__current_order is None else "Meşgul"
         }
     
     def get_today_orders(self) -> List[Dict]:
         """Bugün tamamlanan siparişler"""
-        today = datetime.now().date()
-        today_orders = []
-        
-        for order_info in self.__orders_completed:
-            order_date = datetime.fromisoformat(order_info["completed_at"]).date()
-            if order_date == today:
-                today_orders.append(order_info)
-        
-        return today_orders
+        # Zaman damgası ayrıştırılmaz, yanında tutulan tarih karşılaştırılır
+        today = date.today()
+        return [order_info for order_info, completed_date in zip(self.__orders_completed, self.__completed_dates)
+                if completed_date == today]
     
     # Tecrübeye göre bonus hesaplama
     def get_experience_bonus(self) -> float:
         """Tecrübeye göre bonus katsayısı"""
-        if self.__experience_years >= 5:
-            return 1.5  # %50 bonus
-        elif self.__experience_years >= 3:
-            return 1.3  # %30 bonus
-        elif self.__experience_years >= 1:
-            return 1.1  # %10 bonus
-        return 1.0  # Bonus yok
+        return next((bonus for min_years, bonus in Barista._BONUS_TIERS
+                     if self.__experience_years >= min_years), 1.0)
     
     def calculate_monthly_salary(self, hours_per_month: float = 160) -> float:
         """Aylık maaş tahmini (tecrübe bonusu dahil)"""
@@ -238,25 +247,29 @@ class Barista:
     
     # JSON için
     def to_dict(self) -> Dict:
+        stats = self.get_statistics()
         return {
             "id": self.__id,
             "name": self.__name,
             "email": self.__email,
             "experience_years": self.__experience_years,
             "hourly_rate": self.__hourly_rate,
-            "total_orders_completed": self.total_orders_completed,
+            "total_orders_completed": stats["total_orders"],
             "total_earnings": self.__total_earnings,
             "is_on_duty": self.__is_on_duty,
             "performance_rating": self.__performance_rating,
-            "statistics": self.get_statistics()
+            "statistics": stats
         }
     
     @classmethod
     def from_dict(cls, data: Dict):
-        """Dictionary'den Barista oluştur"""
-        return cls(
+        """Dictionary'den Barista oluştur (vardiya dışı başlar, istatistikler yeni oturumdan hesaplanır)"""
+        barista = cls(
             name=data["name"],
             email=data["email"],
             experience_years=data["experience_years"],
             hourly_rate=data["hourly_rate"]
-        )
\ No newline at end of file
+        )
+        barista.__total_earnings = data.get("total_earnings", 0.0)
+        barista.__performance_rating = data.get("performance_rating", 5.0)
+        return barista
\ No newline at end of file
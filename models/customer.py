@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import Dict, Optional
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -6,6 +6,10 @@ class Customer(ABC):
     """Müşteri base class (Abstract)"""
     
     _id_counter = 1
+    _POINTS_PER_10 = 1  # Her 10₺ için kazanılan puan (alt sınıflar değiştirir)
+    
+    __slots__ = ("_id", "_name", "_email", "_name_key", "_email_key", "_phone", "_balance",
+                 "_order_count", "_last_order_id", "_created_at", "_loyalty_points", "_total_spent")
     
     def __init__(self, name: str, email: str, phone: str, balance: float = 0.0):
         self._id = Customer._id_counter
@@ -13,11 +17,15 @@ class Customer(ABC):
         
         self._name = name
         self._email = email
+        self._name_key = name.lower()  # İsim indeksi anahtarı (bir kez hesaplanır)
+        self._email_key = email.strip().lower()  # Email indeksi anahtarı (bir kez hesaplanır)
         self._phone = phone
         self._balance = balance
-        self._order_history = []  # Sipariş geçmişi
+        self._order_count = 0  # Verilen sipariş sayısı
+        self._last_order_id = None  # Son siparişin ID'si
         self._created_at = datetime.now()
         self._loyalty_points = 0
+        self._total_spent = 0.0  # Teslim edilen siparişlerin toplamı
     
     # Properties
     @property
@@ -32,6 +40,14 @@ class Customer(ABC):
     def email(self) -> str:
         return self._email
     
+    @property
+    def name_key(self) -> str:
+        return self._name_key
+    
+    @property
+    def email_key(self) -> str:
+        return self._email_key
+    
     @property
     def balance(self) -> float:
         return self._balance
@@ -41,8 +57,16 @@ class Customer(ABC):
         return self._loyalty_points
     
     @property
-    def order_history(self) -> List:
-        return self._order_history.copy()
+    def total_spent(self) -> float:
+        return self._total_spent
+    
+    @property
+    def order_count(self) -> int:
+        return self._order_count
+    
+    @property
+    def last_order_id(self) -> Optional[int]:
+        return self._last_order_id
     
     # Balance yönetimi
     def add_balance(self, amount: float):
@@ -61,12 +85,13 @@ class Customer(ABC):
     
     # Sipariş geçmişine ekle
     def add_to_history(self, order):
-        """Siparişi geçmişe ekle"""
-        self._order_history.append({
-            "order_id": order.id,
-            "date": datetime.now().isoformat(),
-            "total": order.total_price
-        })
+        """Siparişi geçmişe işle (detaylar CafeManager'dan sayfa sayfa alınır)"""
+        self._order_count += 1
+        self._last_order_id = order.id
+    
+    def add_spending(self, amount: float):
+        """Teslim edilen siparişin tutarını toplam harcamaya ekle"""
+        self._total_spent += amount
     
     # Abstract method - Her müşteri tipi kendi indirimini belirler
     @abstractmethod
@@ -74,11 +99,10 @@ class Customer(ABC):
         """İndirim hesapla (Her subclass implement etmeli)"""
         pass
     
-    # Abstract method - Sadakat puanı hesaplama
-    @abstractmethod
+    # Sadakat puanı hesaplama - oran müşteri tipinin _POINTS_PER_10 değeri
     def earn_loyalty_points(self, amount: float):
         """Sadakat puanı kazan"""
-        pass
+        self._loyalty_points += int(amount // 10) * self._POINTS_PER_10
     
     def __str__(self) -> str:
         customer_type = self.__class__.__name__
@@ -95,15 +119,32 @@ class Customer(ABC):
             "phone": self._phone,
             "balance": self._balance,
             "loyalty_points": self._loyalty_points,
-            "order_history": self._order_history,
+            "total_spent": self._total_spent,
+            "order_count": self._order_count,
+            "last_order_id": self._last_order_id,
             "created_at": self._created_at.isoformat(),
             "type": self.__class__.__name__
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict):
+        """Dictionary'den müşteri oluştur (puan ve harcama geri yüklenir)"""
+        customer = cls(data["name"], data["email"], data["phone"], data["balance"])
+        customer._loyalty_points = data.get("loyalty_points", 0)
+        customer._total_spent = data.get("total_spent", 0.0)
+        # Siparişler kaydedilmez: sipariş sayısı ve son sipariş ID'si yeni oturumda sıfırdan başlar
+        if data.get("created_at"):
+            customer._created_at = datetime.fromisoformat(data["created_at"])
+        return customer
 
 
 class RegularCustomer(Customer):
     """Normal müşteri - %0 indirim"""
     
+    _POINTS_PER_10 = 1  # Her 10₺'ye 1 puan
+    
+    __slots__ = ("_discount_rate",)
+    
     def __init__(self, name: str, email: str, phone: str, balance: float = 0.0):
         super().__init__(name, email, phone, balance)
         self._discount_rate = 0.0
@@ -111,16 +152,15 @@ class RegularCustomer(Customer):
     def calculate_discount(self, amount: float) -> float:
         """Normal müşteriye indirim yok"""
         return 0.0
-    
-    def earn_loyalty_points(self, amount: float):
-        """Her 10₺'ye 1 puan"""
-        points = int(amount / 10)
-        self._loyalty_points += points
 
 
 class PremiumCustomer(Customer):
     """Premium müşteri - %10 indirim"""
     
+    _POINTS_PER_10 = 2  # Her 10₺'ye 2 puan (2x kazanır)
+    
+    __slots__ = ("_discount_rate", "_membership_fee", "_free_drinks_count")
+    
     def __init__(self, name: str, email: str, phone: str, balance: float = 0.0, membership_fee: float = 50.0):
         super().__init__(name, email, phone, balance)
         self._discount_rate = 0.10
@@ -135,11 +175,6 @@ class PremiumCustomer(Customer):
         """Premium müşteriye %10 indirim"""
         return amount * self._discount_rate
     
-    def earn_loyalty_points(self, amount: float):
-        """Her 10₺'ye 2 puan (2x kazanır)"""
-        points = int(amount / 10) * 2
-        self._loyalty_points += points
-    
     def add_free_drink(self):
         """Bedava içecek hakkı ekle"""
         self._free_drinks_count += 1
@@ -159,6 +194,10 @@ class PremiumCustomer(Customer):
 class VIPCustomer(Customer):
     """VIP müşteri - %20 indirim + özel avantajlar"""
     
+    _POINTS_PER_10 = 3  # Her 10₺'ye 3 puan (3x kazanır)
+    
+    __slots__ = ("_discount_rate", "_priority_service")
+    
     def __init__(self, name: str, email: str, phone: str, balance: float = 0.0):
         super().__init__(name, email, phone, balance)
         self._discount_rate = 0.20
@@ -176,11 +215,6 @@ class VIPCustomer(Customer):
         """VIP müşteriye %20 indirim"""
         return amount * self._discount_rate
     
-    def earn_loyalty_points(self, amount: float):
-        """Her 10₺'ye 3 puan (3x kazanır)"""
-        points = int(amount / 10) * 3
-        self._loyalty_points += points
-    
     def __str__(self) -> str:
         return (f"⭐VIP⭐: {self._name} (Bakiye: {self._balance:.2f}₺, "
                 f"Puan: {self._loyalty_points}, Öncelikli Servis)")
\ No newline at end of file
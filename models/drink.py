@@ -1,11 +1,16 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime
+import sys
 
 class Drink:
     """Kahve dükkanındaki içecekleri temsil eden sınıf"""
     
     # Class variable - tüm içecekler için ortak
     _id_counter = 1
+    _SIZE_MULT = {"Small": 0.8, "Medium": 1.0, "Large": 1.3}  # Boyut -> fiyat çarpanı
+    
+    __slots__ = ("__id", "__name", "__price", "__category", "__ingredients", "__size",
+                 "__created_at", "__search_text", "__final_price", "__menu")
     
     def __init__(self, name: str, price: float, category: str, ingredients: List[str], size: str = "Medium"):
         """
@@ -19,12 +24,17 @@ class Drink:
         self.__id = Drink._id_counter
         Drink._id_counter += 1
         
-        self.__name = name
+        # İsim ve boyut tüm siparişlerde tekrarlanır, tek kopya paylaşılsın
+        self.__name = sys.intern(name)
         self.__price = price
         self.__category = category
-        self.__ingredients = ingredients
-        self.__size = size
+        self.__ingredients = tuple(ingredients)  # Değiştirilemez, dışarıya kopyalamadan verilir
+        self.__size = sys.intern(size)
         self.__created_at = datetime.now()
+        # Arama için isim ve malzemeler bir kez küçük harfe çevrilir (satır satır)
+        self.__search_text = "\n".join((name,) + self.__ingredients).lower()
+        self.__final_price = self._compute_final_price()
+        self.__menu = None  # İçinde bulunduğu Menu (fiyat/boyut değişince haber verilir)
     
     # Property decorators - Encapsulation için
     @property
@@ -44,35 +54,54 @@ class Drink:
         if value < 0:
             raise ValueError("Fiyat negatif olamaz!")
         self.__price = value
+        self.__final_price = self._compute_final_price()
+        if self.__menu is not None:
+            self.__menu.drink_price_changed(self)
     
     @property
     def category(self) -> str:
         return self.__category
     
     @property
-    def ingredients(self) -> List[str]:
-        return self.__ingredients.copy()  # Kopya döndür (encapsulation)
+    def ingredients(self) -> Tuple[str, ...]:
+        return self.__ingredients
     
     @property
     def size(self) -> str:
         return self.__size
     
+    @property
+    def search_text(self) -> str:
+        return self.__search_text
+    
     @size.setter
     def size(self, value: str):
-        valid_sizes = ["Small", "Medium", "Large"]
-        if value not in valid_sizes:
-            raise ValueError(f"Boyut sadece {valid_sizes} olabilir!")
-        self.__size = value
+        if value not in Drink._SIZE_MULT:
+            raise ValueError(f"Boyut sadece {list(Drink._SIZE_MULT)} olabilir!")
+        old_size = self.__size
+        self.__size = sys.intern(value)
+        self.__final_price = self._compute_final_price()
+        if self.__menu is not None:
+            # Boyut menü indeksinin anahtarında: menü yeniden anahtarlar, çakışırsa geri alınır
+            try:
+                self.__menu.drink_size_changed(self, old_size)
+            except ValueError:
+                self.__size = old_size
+                self.__final_price = self._compute_final_price()
+                raise
     
     # Boyuta göre fiyat hesaplama (business logic)
     def get_final_price(self) -> float:
+        """Boyuta göre fiyat (fiyat/boyut değişince yeniden hesaplanır)"""
+        return self.__final_price
+    
+    def set_menu(self, menu):
+        """İçeceğin bulunduğu menüyü ata (Menu ekleyip çıkarırken çağırır)"""
+        self.__menu = menu
+    
+    def _compute_final_price(self) -> float:
         """Boyuta göre fiyat hesapla"""
-        size_multipliers = {
-            "Small": 0.8,
-            "Medium": 1.0,
-            "Large": 1.3
-        }
-        return self.__price * size_multipliers[self.__size]
+        return self.__price * Drink._SIZE_MULT[self.__size]
     
     # Static method - utility function
     @staticmethod
@@ -107,6 +136,10 @@ class Drink:
             return False
         return self.__name == other.__name and self.__size == other.__size
     
+    def __hash__(self) -> int:
+        """__eq__ ile tutarlı hash (set/dict anahtarı olarak kullanılabilir)"""
+        return hash((self.__name, self.__size))
+    
     def __lt__(self, other) -> bool:
         """Fiyat karşılaştırması için"""
         if not isinstance(other, Drink):
@@ -121,7 +154,7 @@ class Drink:
             "name": self.__name,
             "price": self.__price,
             "category": self.__category,
-            "ingredients": self.__ingredients,
+            "ingredients": list(self.__ingredients),
             "size": self.__size,
             "created_at": self.__created_at.isoformat()
         }
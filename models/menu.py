@@ -1,41 +1,60 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from bisect import bisect_left, bisect_right
 from models.drink import Drink
 
 class Menu:
     """Menü yönetim sınıfı"""
     
-    def __init__(self):
-        self.__drinks = []  # Menüdeki tüm içecekler
-        self.__categories = set()  # Kategoriler
-        self._initialize_default_menu()
+    _CATEGORY_ICONS = {"Hot": "☕", "Cold": "🧊", "Dessert": "🍰", "Food": "🥐"}  # Kategori -> ikon
     
-    def _initialize_default_menu(self):
-        """Varsayılan menüyü oluştur"""
+    # Varsayılan menü: (isim, fiyat, kategori, malzemeler, boyut) - tüm Menu'ler paylaşır
+    _DEFAULT_MENU = (
         # Sıcak İçecekler
-        self.add_drink(Drink("Espresso", 25.0, "Hot", ["Coffee Beans", "Water"], "Small"))
-        self.add_drink(Drink("Americano", 30.0, "Hot", ["Espresso", "Water"], "Medium"))
-        self.add_drink(Drink("Latte", 35.0, "Hot", ["Espresso", "Milk", "Foam"], "Medium"))
-        self.add_drink(Drink("Cappuccino", 40.0, "Hot", ["Espresso", "Milk", "Foam"], "Medium"))
-        self.add_drink(Drink("Mocha", 45.0, "Hot", ["Espresso", "Milk", "Chocolate", "Whipped Cream"], "Medium"))
-        self.add_drink(Drink("Turkish Coffee", 28.0, "Hot", ["Turkish Coffee", "Water"], "Small"))
-        self.add_drink(Drink("Hot Chocolate", 35.0, "Hot", ["Milk", "Chocolate", "Whipped Cream"], "Medium"))
+        ("Espresso", 25.0, "Hot", ("Coffee Beans", "Water"), "Small"),
+        ("Americano", 30.0, "Hot", ("Espresso", "Water"), "Medium"),
+        ("Latte", 35.0, "Hot", ("Espresso", "Milk", "Foam"), "Medium"),
+        ("Cappuccino", 40.0, "Hot", ("Espresso", "Milk", "Foam"), "Medium"),
+        ("Mocha", 45.0, "Hot", ("Espresso", "Milk", "Chocolate", "Whipped Cream"), "Medium"),
+        ("Turkish Coffee", 28.0, "Hot", ("Turkish Coffee", "Water"), "Small"),
+        ("Hot Chocolate", 35.0, "Hot", ("Milk", "Chocolate", "Whipped Cream"), "Medium"),
         
         # Soğuk İçecekler
-        self.add_drink(Drink("Iced Latte", 38.0, "Cold", ["Espresso", "Milk", "Ice"], "Large"))
-        self.add_drink(Drink("Iced Americano", 32.0, "Cold", ["Espresso", "Water", "Ice"], "Large"))
-        self.add_drink(Drink("Frappuccino", 48.0, "Cold", ["Espresso", "Milk", "Ice", "Whipped Cream"], "Large"))
-        self.add_drink(Drink("Cold Brew", 42.0, "Cold", ["Cold Brew Coffee", "Ice"], "Large"))
-        self.add_drink(Drink("Iced Tea", 25.0, "Cold", ["Tea", "Ice", "Lemon"], "Large"))
+        ("Iced Latte", 38.0, "Cold", ("Espresso", "Milk", "Ice"), "Large"),
+        ("Iced Americano", 32.0, "Cold", ("Espresso", "Water", "Ice"), "Large"),
+        ("Frappuccino", 48.0, "Cold", ("Espresso", "Milk", "Ice", "Whipped Cream"), "Large"),
+        ("Cold Brew", 42.0, "Cold", ("Cold Brew Coffee", "Ice"), "Large"),
+        ("Iced Tea", 25.0, "Cold", ("Tea", "Ice", "Lemon"), "Large"),
         
         # Tatlılar
-        self.add_drink(Drink("Cheesecake", 55.0, "Dessert", ["Cream Cheese", "Graham Cracker"], "Medium"))
-        self.add_drink(Drink("Brownie", 40.0, "Dessert", ["Chocolate", "Flour", "Eggs"], "Medium"))
-        self.add_drink(Drink("Tiramisu", 60.0, "Dessert", ["Mascarpone", "Coffee", "Ladyfingers"], "Medium"))
+        ("Cheesecake", 55.0, "Dessert", ("Cream Cheese", "Graham Cracker"), "Medium"),
+        ("Brownie", 40.0, "Dessert", ("Chocolate", "Flour", "Eggs"), "Medium"),
+        ("Tiramisu", 60.0, "Dessert", ("Mascarpone", "Coffee", "Ladyfingers"), "Medium"),
         
         # Yiyecekler
-        self.add_drink(Drink("Croissant", 30.0, "Food", ["Flour", "Butter"], "Medium"))
-        self.add_drink(Drink("Muffin", 28.0, "Food", ["Flour", "Eggs", "Sugar"], "Medium"))
-        self.add_drink(Drink("Sandwich", 45.0, "Food", ["Bread", "Cheese", "Vegetables"], "Medium"))
+        ("Croissant", 30.0, "Food", ("Flour", "Butter"), "Medium"),
+        ("Muffin", 28.0, "Food", ("Flour", "Eggs", "Sugar"), "Medium"),
+        ("Sandwich", 45.0, "Food", ("Bread", "Cheese", "Vegetables"), "Medium"),
+    )
+    
+    __slots__ = ("__drinks", "__drinks_by_id", "__drinks_by_key", "__name_counts", "__categories",
+                 "__version", "__stats_cache", "__sorted_cache")
+    
+    def __init__(self):
+        self.__drinks = []  # Menüdeki tüm içecekler
+        self.__drinks_by_id = {}  # ID -> Drink (hızlı arama)
+        self.__drinks_by_key = {}  # (isim küçük harf, boyut) -> Drink
+        self.__name_counts = {}  # İsim (küçük harf) -> kaç boyutta menüde
+        self.__categories = {}  # Kategori -> o kategorideki içecekler (ekleme/silmede güncellenir)
+        self.__version = 0  # Her ekleme/silmede artar
+        self.__stats_cache = None  # (version, stats, en pahalı, en ucuz)
+        self.__sorted_cache = {}  # Sıralama türü -> (version, sıralı liste)
+        self._initialize_default_menu()
+    
+    def _initialize_default_menu(self):
+        """Varsayılan menüyü oluştur (sabit listeden, tekrar kontrolü olmadan)"""
+        for name, price, category, ingredients, size in Menu._DEFAULT_MENU:
+            drink = Drink(name, price, category, ingredients, size)
+            self._index_drink(drink, self._drink_key(name, size))
     
     # Menü yönetimi
     def add_drink(self, drink: Drink):
@@ -44,75 +63,109 @@ class Menu:
             raise TypeError("Sadece Drink objesi eklenebilir!")
         
         # Aynı isim ve boyutta ürün varsa ekleme
-        for existing_drink in self.__drinks:
-            if existing_drink.name == drink.name and existing_drink.size == drink.size:
-                raise ValueError(f"{drink.name} ({drink.size}) zaten menüde!")
+        key = self._drink_key(drink.name, drink.size)
+        if key in self.__drinks_by_key:
+            raise ValueError(f"{drink.name} ({drink.size}) zaten menüde!")
         
-        self.__drinks.append(drink)
-        self.__categories.add(drink.category)
+        self._index_drink(drink, key)
         return True
     
+    def _index_drink(self, drink: Drink, key: Tuple[str, str]):
+        """İçeceği listeye ve tüm indekslere ekle (kontroller çağıranda)"""
+        self.__drinks.append(drink)
+        self.__drinks_by_id[drink.id] = drink
+        self.__drinks_by_key[key] = drink
+        self.__name_counts[key[0]] = self.__name_counts.get(key[0], 0) + 1
+        self.__categories.setdefault(drink.category, []).append(drink)
+        drink.set_menu(self)
+        self.__version += 1
+    
     def remove_drink(self, drink_name: str, size: str = "Medium") -> bool:
         """Menüden içecek çıkar"""
-        for i, drink in enumerate(self.__drinks):
-            if drink.name == drink_name and drink.size == size:
-                self.__drinks.pop(i)
-                return True
-        return False
+        drink = self.__drinks_by_key.get(self._drink_key(drink_name, size))
+        if drink is None:
+            return False
+        self._unindex_drink(drink)
+        return True
     
     def remove_drink_by_id(self, drink_id: int) -> bool:
         """ID'ye göre içecek çıkar"""
-        for i, drink in enumerate(self.__drinks):
-            if drink.id == drink_id:
-                self.__drinks.pop(i)
-                return True
-        return False
+        drink = self.__drinks_by_id.get(drink_id)
+        if drink is None:
+            return False
+        self._unindex_drink(drink)
+        return True
+    
+    def _unindex_drink(self, drink: Drink):
+        """İçeceği listeden ve tüm indekslerden çıkar"""
+        key = self._drink_key(drink.name, drink.size)
+        self.__drinks.remove(drink)
+        del self.__drinks_by_id[drink.id]
+        del self.__drinks_by_key[key]
+        self.__name_counts[key[0]] -= 1
+        if not self.__name_counts[key[0]]:
+            del self.__name_counts[key[0]]
+        self.__categories[drink.category].remove(drink)
+        drink.set_menu(None)
+        self.__version += 1
+    
+    def drink_price_changed(self, drink: Drink):
+        """Menüdeki bir içeceğin fiyatı değişti: fiyata bağlı önbellekler geçersiz"""
+        self.__version += 1
+    
+    def drink_size_changed(self, drink: Drink, old_size: str):
+        """Menüdeki bir içeceğin boyutu değişti: (isim, boyut) indeksini güncelle"""
+        new_key = self._drink_key(drink.name, drink.size)
+        existing = self.__drinks_by_key.get(new_key)
+        if existing is not None and existing is not drink:
+            raise ValueError(f"{drink.name} ({drink.size}) zaten menüde!")
+        
+        del self.__drinks_by_key[self._drink_key(drink.name, old_size)]
+        self.__drinks_by_key[new_key] = drink
+        self.__version += 1
+    
+    @staticmethod
+    def _drink_key(name: str, size: str) -> Tuple[str, str]:
+        """İsim/boyut indeksi anahtarı (isim büyük/küçük harf duyarsız)"""
+        return (name.lower(), size)
     
     def clear_menu(self):
         """Menüyü temizle"""
+        for drink in self.__drinks:
+            drink.set_menu(None)
         self.__drinks.clear()
+        self.__drinks_by_id.clear()
+        self.__drinks_by_key.clear()
+        self.__name_counts.clear()
         self.__categories.clear()
+        self.__version += 1
     
     # Arama ve filtreleme
     def get_drink_by_name(self, name: str, size: str = "Medium") -> Optional[Drink]:
         """İsme ve boyuta göre içecek bul"""
-        for drink in self.__drinks:
-            if drink.name.lower() == name.lower() and drink.size == size:
-                return drink
-        return None
+        return self.__drinks_by_key.get(self._drink_key(name, size))
     
     def get_drink_by_id(self, drink_id: int) -> Optional[Drink]:
         """ID'ye göre içecek bul"""
-        for drink in self.__drinks:
-            if drink.id == drink_id:
-                return drink
-        return None
+        return self.__drinks_by_id.get(drink_id)
     
     def search_drinks(self, keyword: str) -> List[Drink]:
         """Anahtar kelimeye göre ara"""
+        # İsimde veya malzemelerde ara (her satır ayrı bir alan)
         keyword = keyword.lower()
-        results = []
-        
-        for drink in self.__drinks:
-            # İsimde veya malzemelerde ara
-            if keyword in drink.name.lower():
-                results.append(drink)
-            else:
-                for ingredient in drink.ingredients:
-                    if keyword in ingredient.lower():
-                        results.append(drink)
-                        break
-        
-        return results
+        return [drink for drink in self.__drinks if keyword in drink.search_text]
     
     def get_drinks_by_category(self, category: str) -> List[Drink]:
         """Kategoriye göre filtrele"""
-        return [drink for drink in self.__drinks if drink.category == category]
+        return list(self.__categories.get(category, ()))
     
     def get_drinks_by_price_range(self, min_price: float, max_price: float) -> List[Drink]:
-        """Fiyat aralığına göre filtrele"""
-        return [drink for drink in self.__drinks 
-                if min_price <= drink.get_final_price() <= max_price]
+        """Fiyat aralığına göre filtrele (fiyata göre artan sırada)"""
+        # Sıralı fiyat listesinde ikili arama: tüm menüyü taramaz
+        drinks, prices = self._get_price_index()
+        start = bisect_left(prices, min_price)
+        end = bisect_right(prices, max_price)
+        return drinks[start:end]
     
     def get_all_drinks(self) -> List[Drink]:
         """Tüm içecekleri getir"""
@@ -125,49 +178,79 @@ class Menu:
     # Sıralama
     def get_drinks_sorted_by_price(self, ascending: bool = True) -> List[Drink]:
         """Fiyata göre sırala"""
-        return sorted(self.__drinks, key=lambda d: d.get_final_price(), reverse=not ascending)
+        return self._get_sorted(("price", ascending), lambda d: d.get_final_price(), not ascending).copy()
     
     def get_drinks_sorted_by_name(self) -> List[Drink]:
         """İsme göre sırala"""
-        return sorted(self.__drinks, key=lambda d: d.name)
+        return self._get_sorted(("name", True), lambda d: d.name).copy()
+    
+    def _get_sorted(self, cache_key: Tuple[str, bool], key, reverse: bool = False) -> List[Drink]:
+        """Sıralı listeyi menü değişene kadar önbellekte tut (dışarıya kopyası verilmeli)"""
+        cached = self.__sorted_cache.get(cache_key)
+        if cached is None or cached[0] != self.__version:
+            cached = (self.__version, sorted(self.__drinks, key=key, reverse=reverse))
+            self.__sorted_cache[cache_key] = cached
+        return cached[1]
+    
+    def _get_price_index(self) -> Tuple[List[Drink], List[float]]:
+        """Fiyata göre artan sıralı içecekler ve aynı sıradaki fiyatları"""
+        cached = self.__sorted_cache.get(("price_index", True))
+        if cached is None or cached[0] != self.__version:
+            drinks = self._get_sorted(("price", True), lambda d: d.get_final_price())
+            cached = (self.__version, drinks, [drink.get_final_price() for drink in drinks])
+            self.__sorted_cache[("price_index", True)] = cached
+        return cached[1], cached[2]
     
     # İstatistikler
-    def get_menu_statistics(self) -> Dict:
-        """Menü istatistikleri"""
+    def _get_cached_statistics(self):
+        """İstatistikleri tek geçişte hesapla, menü değişene kadar önbellekte tut"""
+        if self.__stats_cache is not None and self.__stats_cache[0] == self.__version:
+            return self.__stats_cache
+        
         if not self.__drinks:
-            return {
+            stats = {
                 "total_items": 0,
                 "categories": [],
                 "avg_price": 0,
                 "min_price": 0,
                 "max_price": 0
             }
+            self.__stats_cache = (self.__version, stats, None, None)
+            return self.__stats_cache
         
+        # Fiyatlar bir kez toplanır; sum/min/max döngüleri C tarafında çalışır
         prices = [drink.get_final_price() for drink in self.__drinks]
+        max_price = max(prices)
+        min_price = min(prices)
+        most_expensive = self.__drinks[prices.index(max_price)]
+        cheapest = self.__drinks[prices.index(min_price)]
         
-        return {
+        stats = {
             "total_items": len(self.__drinks),
             "categories": self.get_categories(),
             "avg_price": sum(prices) / len(prices),
-            "min_price": min(prices),
-            "max_price": max(prices),
-            "items_per_category": {
-                category: len(self.get_drinks_by_category(category))
-                for category in self.__categories
-            }
+            "min_price": min_price,
+            "max_price": max_price,
+            "items_per_category": {category: len(drinks) for category, drinks in self.__categories.items()}
         }
+        self.__stats_cache = (self.__version, stats, most_expensive, cheapest)
+        return self.__stats_cache
+    
+    def get_menu_statistics(self) -> Dict:
+        """Menü istatistikleri"""
+        stats = self._get_cached_statistics()[1].copy()
+        stats["categories"] = stats["categories"].copy()
+        if "items_per_category" in stats:
+            stats["items_per_category"] = stats["items_per_category"].copy()
+        return stats
     
     def get_most_expensive_drink(self) -> Optional[Drink]:
         """En pahalı içecek"""
-        if not self.__drinks:
-            return None
-        return max(self.__drinks, key=lambda d: d.get_final_price())
+        return self._get_cached_statistics()[2]
     
     def get_cheapest_drink(self) -> Optional[Drink]:
         """En ucuz içecek"""
-        if not self.__drinks:
-            return None
-        return min(self.__drinks, key=lambda d: d.get_final_price())
+        return self._get_cached_statistics()[3]
     
     # Görsel gösterim
     def display_menu(self, category: Optional[str] = None):
@@ -190,8 +273,7 @@ class Menu:
                 print(f"\n📋 {current_category}:")
                 print("-"*60)
             
-            # İkon seç
-            icon = "☕" if drink.category == "Hot" else "🧊" if drink.category == "Cold" else "🍰" if drink.category == "Dessert" else "🥐"
+            icon = Menu._CATEGORY_ICONS.get(drink.category, "🥐")
             
             print(f"{icon} {drink.id}. {drink.name} ({drink.size})")
             print(f"   Fiyat: {drink.get_final_price():.2f}₺")
@@ -211,7 +293,7 @@ class Menu:
         print("="*60 + "\n")
         
         for i, drink in enumerate(self.__drinks, 1):
-            icon = "☕" if drink.category == "Hot" else "🧊" if drink.category == "Cold" else "🍰" if drink.category == "Dessert" else "🥐"
+            icon = Menu._CATEGORY_ICONS.get(drink.category, "🥐")
             print(f"{i}. {icon} {drink.name:<20} ({drink.size:<6}) - {drink.get_final_price():>6.2f}₺")
         
         print("\n" + "="*60 + "\n")
@@ -224,9 +306,10 @@ class Menu:
     def __contains__(self, item) -> bool:
         """'Latte' in menu kontrolü"""
         if isinstance(item, str):
-            return any(drink.name.lower() == item.lower() for drink in self.__drinks)
+            return item.lower() in self.__name_counts
         elif isinstance(item, Drink):
-            return item in self.__drinks
+            drink = self.__drinks_by_key.get(self._drink_key(item.name, item.size))
+            return drink is not None and drink == item
         return False
     
     def __getitem__(self, index: int) -> Drink:
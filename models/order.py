@@ -1,6 +1,8 @@
-from typing import List, Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
+import time
 from enum import Enum
+from itertools import count
 
 class OrderStatus(Enum):
     """Sipariş durumları (Enum kullanımı)"""
@@ -11,10 +13,20 @@ class OrderStatus(Enum):
     CANCELLED = "İptal Edildi"
 
 
+# İptal edilemeyen durumlar (her çağrıda liste kurulmasın)
+_UNCANCELLABLE = frozenset({OrderStatus.DELIVERED, OrderStatus.CANCELLED})
+
+# Sipariş ID üreteci (tek adımda sıradaki numara)
+_order_ids = count(1)
+
+
 class Order:
     """Sipariş sınıfı - Composition örneği (içinde Drink ve Customer var)"""
     
-    _id_counter = 1
+    __slots__ = ("__id", "__customer", "__barista", "__items", "__status", "__created_at",
+                 "__prepared_at", "__delivered_at", "__created_mono", "__prepared_mono",
+                 "__notes", "__discount_applied", "__subtotal", "__total", "__items_view",
+                 "__item_count")
     
     def __init__(self, customer, barista=None):
         """
@@ -22,18 +34,24 @@ class Order:
             customer: Customer objesi
             barista: Barista objesi (opsiyonel)
         """
-        self.__id = Order._id_counter
-        Order._id_counter += 1
+        self.__id = next(_order_ids)
         
         self.__customer = customer  # Composition: Order "has-a" Customer
         self.__barista = barista
-        self.__items = []  # List of (Drink, quantity) tuples
+        self.__items = {}  # (isim, boyut) -> (Drink, quantity), ekleme sırası korunur
+        self.__item_count = 0  # Toplam adet (ekle/çıkar ile güncellenir)
         self.__status = OrderStatus.PENDING
         self.__created_at = datetime.now()
         self.__prepared_at = None
+        # Süre hesapları için monotonik saat (datetime alanları gösterim/kayıt için)
+        self.__created_mono = time.monotonic()
+        self.__prepared_mono = None
         self.__delivered_at = None
         self.__notes = ""
         self.__discount_applied = 0.0
+        self.__subtotal = None  # Önbellek (sepet değişince sıfırlanır)
+        self.__total = None
+        self.__items_view = None  # items için değişmez önbellek
     
     # Properties
     @property
@@ -54,13 +72,20 @@ class Order:
         self.__barista = barista
     
     @property
-    def items(self) -> List:
-        return self.__items.copy()
+    def items(self) -> Tuple:
+        """(Drink, adet) çiftleri - sepet değişene kadar aynı tuple döner"""
+        if self.__items_view is None:
+            self.__items_view = tuple(self.__items.values())
+        return self.__items_view
     
     @property
     def status(self) -> OrderStatus:
         return self.__status
     
+    @property
+    def prepared_at(self) -> Optional[datetime]:
+        return self.__prepared_at
+    
     @property
     def notes(self) -> str:
         return self.__notes
@@ -75,49 +100,73 @@ class Order:
         if quantity <= 0:
             raise ValueError("Miktar pozitif olmalı!")
         
-        # Aynı ürün varsa miktarı artır
-        for i, (existing_drink, qty) in enumerate(self.__items):
-            if existing_drink == drink:
-                self.__items[i] = (existing_drink, qty + quantity)
-                return
-        
-        # Yoksa yeni ekle
-        self.__items.append((drink, quantity))
+        # Aynı ürün (isim + boyut) varsa miktarı artır, yoksa yeni ekle
+        key = self._item_key(drink)
+        existing = self.__items.get(key)
+        if existing:
+            self.__items[key] = (existing[0], existing[1] + quantity)
+        else:
+            self.__items[key] = (drink, quantity)
+        self.__item_count += quantity
+        self._invalidate_totals()
     
     def remove_item(self, drink):
         """Siparişten ürün çıkar"""
-        self.__items = [(d, q) for d, q in self.__items if d != drink]
+        removed = self.__items.pop(self._item_key(drink), None)
+        if removed:
+            self.__item_count -= removed[1]
+        self._invalidate_totals()
+    
+    @staticmethod
+    def _item_key(drink):
+        """Sepet anahtarı - Drink.__eq__ ile aynı alanlar"""
+        return (drink.name, drink.size)
     
     def clear_items(self):
         """Tüm ürünleri temizle"""
         self.__items.clear()
+        self.__item_count = 0
+        self._invalidate_totals()
+    
+    def _invalidate_totals(self):
+        """Sepet değişti, önbellekteki toplamları ve ürün görünümünü sıfırla"""
+        self.__subtotal = None
+        self.__total = None
+        self.__items_view = None
     
     # Fiyat hesaplamaları
     def calculate_subtotal(self) -> float:
         """Ara toplam (indirim öncesi)"""
-        total = 0.0
-        for drink, quantity in self.__items:
-            total += drink.get_final_price() * quantity
-        return total
+        if self.__subtotal is None:
+            total = 0.0
+            for drink, quantity in self.__items.values():
+                total += drink.get_final_price() * quantity
+            self.__subtotal = total
+        return self.__subtotal
     
     def calculate_discount(self) -> float:
         """İndirim miktarını hesapla"""
-        subtotal = self.calculate_subtotal()
-        discount = self.__customer.calculate_discount(subtotal)
-        self.__discount_applied = discount
-        return discount
+        if self.__total is None:
+            self._calculate_totals()
+        return self.__discount_applied
     
     @property
     def total_price(self) -> float:
         """Toplam fiyat (indirim sonrası)"""
+        if self.__total is None:
+            self._calculate_totals()
+        return self.__total
+    
+    def _calculate_totals(self):
+        """İndirim ve toplamı bir kez hesaplayıp önbelleğe al"""
         subtotal = self.calculate_subtotal()
-        discount = self.calculate_discount()
-        return subtotal - discount
+        self.__discount_applied = self.__customer.calculate_discount(subtotal)
+        self.__total = subtotal - self.__discount_applied
     
     # Sipariş durumu yönetimi
     def start_preparation(self, barista):
         """Hazırlamaya başla"""
-        if self.__status != OrderStatus.PENDING:
+        if self.__status is not OrderStatus.PENDING:
             raise ValueError("Sadece bekleyen siparişler hazırlanabilir!")
         
         self.__barista = barista
@@ -126,16 +175,17 @@ class Order:
     
     def mark_as_ready(self):
         """Hazır olarak işaretle"""
-        if self.__status != OrderStatus.PREPARING:
+        if self.__status is not OrderStatus.PREPARING:
             raise ValueError("Sadece hazırlanan siparişler tamamlanabilir!")
         
         self.__status = OrderStatus.READY
         self.__prepared_at = datetime.now()
+        self.__prepared_mono = time.monotonic()
         return True
     
     def mark_as_delivered(self):
         """Teslim edildi olarak işaretle"""
-        if self.__status != OrderStatus.READY:
+        if self.__status is not OrderStatus.READY:
             raise ValueError("Sadece hazır siparişler teslim edilebilir!")
         
         self.__status = OrderStatus.DELIVERED
@@ -144,14 +194,11 @@ class Order:
         # Müşteriye sadakat puanı ekle
         self.__customer.earn_loyalty_points(self.total_price)
         
-        # Müşteri geçmişine ekle
-        self.__customer.add_to_history(self)
-        
         return True
     
     def cancel(self):
         """Siparişi iptal et"""
-        if self.__status in [OrderStatus.DELIVERED, OrderStatus.CANCELLED]:
+        if self.__status in _UNCANCELLABLE:
             raise ValueError("Bu sipariş iptal edilemez!")
         
         self.__status = OrderStatus.CANCELLED
@@ -172,24 +219,22 @@ class Order:
     # Süre hesaplamaları
     def get_preparation_time(self) -> Optional[int]:
         """Hazırlama süresi (dakika)"""
-        if self.__prepared_at and self.__status != OrderStatus.PENDING:
-            delta = self.__prepared_at - self.__created_at
-            return int(delta.total_seconds() / 60)
+        if self.__prepared_mono is not None and self.__status is not OrderStatus.PENDING:
+            return int((self.__prepared_mono - self.__created_mono) / 60)
         return None
     
     def get_waiting_time(self) -> int:
         """Bekleme süresi (dakika)"""
-        delta = datetime.now() - self.__created_at
-        return int(delta.total_seconds() / 60)
+        return int((time.monotonic() - self.__created_mono) / 60)
     
     # İstatistikler
     def get_item_count(self) -> int:
         """Toplam ürün sayısı"""
-        return sum(quantity for _, quantity in self.__items)
+        return self.__item_count
     
     # Dunder methods
     def __str__(self) -> str:
-        items_str = ", ".join([f"{q}x {d.name}" for d, q in self.__items])
+        items_str = ", ".join([f"{q}x {d.name}" for d, q in self.__items.values()])
         return (f"Sipariş #{self.__id} - {self.__customer.name} - "
                 f"{self.__status.value} - {self.total_price:.2f}₺ [{items_str}]")
     
@@ -207,47 +252,56 @@ class Order:
     # Detaylı görünüm
     def get_detailed_info(self) -> str:
         """Detaylı sipariş bilgisi"""
-        info = f"\n{'='*50}\n"
-        info += f"  Sipariş #{self.__id}\n"
-        info += f"{'='*50}\n"
-        info += f"Müşteri: {self.__customer.name}\n"
-        info += f"Durum: {self.__status.value}\n"
-        info += f"Sipariş Zamanı: {self.__created_at.strftime('%H:%M:%S')}\n"
+        total = self.total_price  # İndirimi de günceller
+        subtotal = self.calculate_subtotal()
+        discount = self.__discount_applied
+        
+        parts = [
+            f"\n{'='*50}\n",
+            f"  Sipariş #{self.__id}\n",
+            f"{'='*50}\n",
+            f"Müşteri: {self.__customer.name}\n",
+            f"Durum: {self.__status.value}\n",
+            f"Sipariş Zamanı: {self.__created_at.strftime('%H:%M:%S')}\n",
+        ]
         
         if self.__barista:
-            info += f"Barista: {self.__barista.name}\n"
+            parts.append(f"Barista: {self.__barista.name}\n")
         
-        info += f"\nÜrünler:\n"
-        info += "-" * 50 + "\n"
+        parts.append(f"\nÜrünler:\n")
+        parts.append("-" * 50 + "\n")
         
-        for drink, quantity in self.__items:
+        for drink, quantity in self.__items.values():
             price = drink.get_final_price() * quantity
-            info += f"  {quantity}x {drink.name} ({drink.size})"
-            info += f" - {price:.2f}₺\n"
+            parts.append(f"  {quantity}x {drink.name} ({drink.size}) - {price:.2f}₺\n")
         
-        info += "-" * 50 + "\n"
-        info += f"Ara Toplam: {self.calculate_subtotal():.2f}₺\n"
+        parts.append("-" * 50 + "\n")
+        parts.append(f"Ara Toplam: {subtotal:.2f}₺\n")
         
-        if self.__discount_applied > 0:
-            info += f"İndirim ({self.__customer.__class__.__name__}): -{self.__discount_applied:.2f}₺\n"
+        if discount > 0:
+            parts.append(f"İndirim ({self.__customer.__class__.__name__}): -{discount:.2f}₺\n")
         
-        info += f"TOPLAM: {self.total_price:.2f}₺\n"
+        parts.append(f"TOPLAM: {total:.2f}₺\n")
         
         if self.__notes:
-            info += f"\nNot: {self.__notes}\n"
+            parts.append(f"\nNot: {self.__notes}\n")
         
-        info += "=" * 50 + "\n"
+        parts.append("=" * 50 + "\n")
         
-        return info
+        return "".join(parts)
     
     def to_dict(self) -> Dict:
         """JSON için dictionary'e çevir"""
+        # Tutarlar bir kez alınır, hepsi aynı hesaplamadan gelir
+        total = self.total_price  # İndirimi de günceller
+        subtotal = self.calculate_subtotal()
+        barista = self.__barista
         return {
             "id": self.__id,
             "customer_id": self.__customer.id,
             "customer_name": self.__customer.name,
-            "barista_id": self.__barista.id if self.__barista else None,
-            "barista_name": self.__barista.name if self.__barista else None,
+            "barista_id": barista.id if barista else None,
+            "barista_name": barista.name if barista else None,
             "items": [
                 {
                     "drink_name": drink.name,
@@ -255,12 +309,12 @@ class Order:
                     "quantity": qty,
                     "price": drink.get_final_price()
                 }
-                for drink, qty in self.__items
+                for drink, qty in self.__items.values()
             ],
             "status": self.__status.value,
-            "subtotal": self.calculate_subtotal(),
+            "subtotal": subtotal,
             "discount": self.__discount_applied,
-            "total": self.total_price,
+            "total": total,
             "created_at": self.__created_at.isoformat(),
             "prepared_at": self.__prepared_at.isoformat() if self.__prepared_at else None,
             "delivered_at": self.__delivered_at.isoformat() if self.__delivered_at else None,
@@ -1,5 +1,17 @@
-from typing import Optional
+from typing import Collection, Optional
+from functools import lru_cache
+from itertools import islice
+import os
 import re
+import sys
+
+# Modül yüklenirken bir kez derlenir
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_STRIP = str.maketrans("", "", " -()")  # Telefonda yok sayılan karakterler
+
+# Ekranlarda sürekli kullanılan ayraçlar (her seferinde yeniden üretilmez)
+SEPARATOR = "=" * 60
+THIN_SEPARATOR = "-" * 60
 
 class InputValidator:
     """Kullanıcı girdilerini doğrulama sınıfı"""
@@ -7,14 +19,14 @@ class InputValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Email formatı kontrol et"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        # '@' yoksa regex'e hiç girmeden reddet
+        return "@" in email and _EMAIL_RE.match(email) is not None
     
     @staticmethod
     def validate_phone(phone: str) -> bool:
         """Telefon numarası kontrol et (Türkiye formatı)"""
         # 10 haneli numara veya başında 0 varsa 11 haneli
-        phone = phone.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
+        phone = phone.translate(_PHONE_STRIP)
         
         if len(phone) == 10:
             return phone.isdigit()
@@ -59,8 +71,9 @@ class Formatter:
         return f"{amount:.2f}₺"
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def format_header(text: str, width: int = 60, char: str = "=") -> str:
-        """Başlık formatı"""
+        """Başlık formatı (aynı başlıklar önbellekten döner)"""
         return f"\n{char * width}\n{text.center(width)}\n{char * width}\n"
     
     @staticmethod
@@ -71,15 +84,14 @@ class Formatter:
     @staticmethod
     def format_box(text: str, width: int = 60) -> str:
         """Kutu içinde metin"""
-        lines = text.split("\n")
-        result = "┌" + "─" * (width - 2) + "┐\n"
+        parts = ["┌" + "─" * (width - 2) + "┐\n"]
         
-        for line in lines:
+        for line in text.split("\n"):
             padding = width - len(line) - 4
-            result += f"│ {line}{' ' * padding} │\n"
+            parts.append(f"│ {line}{' ' * padding} │\n")
         
-        result += "└" + "─" * (width - 2) + "┘"
-        return result
+        parts.append("└" + "─" * (width - 2) + "┘")
+        return "".join(parts)
     
     @staticmethod
     def print_success(message: str):
@@ -106,15 +118,16 @@ class MenuHelper:
     """Menü işlemleri için yardımcı sınıf"""
     
     @staticmethod
-    def get_user_choice(prompt: str, valid_choices: list) -> str:
+    def get_user_choice(prompt: str, valid_choices: Collection) -> str:
         """Kullanıcıdan geçerli seçim al"""
+        valid = {str(c) for c in valid_choices}  # Döngüden önce bir kez
         while True:
             choice = input(prompt).strip()
             
-            if choice in [str(c) for c in valid_choices]:
+            if choice in valid:
                 return choice
             
-            Formatter.print_error(f"Geçersiz seçim! Lütfen {valid_choices} arasından seçin.")
+            Formatter.print_error(f"Geçersiz seçim! Lütfen {list(valid_choices)} arasından seçin.")
     
     @staticmethod
     def get_user_input(prompt: str, validator=None, error_message: str = "Geçersiz giriş!") -> str:
@@ -141,16 +154,97 @@ class MenuHelper:
         choice = input(f"{message} (E/H): ").strip().upper()
         return choice == "E"
     
+    @staticmethod
+    def confirm_char(message: str) -> bool:
+        """Enter beklemeden tek tuşla onay al (terminal değilse confirm_action)"""
+        if not sys.stdin.isatty():
+            return MenuHelper.confirm_action(message)
+        
+        sys.stdout.write(f"{message} (E/H): ")
+        sys.stdout.flush()
+        
+        if os.name == 'nt':
+            import msvcrt
+            char = msvcrt.getwch()
+        else:
+            import termios
+            import tty
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            try:
+                tty.setcbreak(fd)
+                char = sys.stdin.read(1)
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        
+        print(char)
+        return char.upper() == "E"
+    
+    @staticmethod
+    def paginate(items: Collection, page_size: int = 20, render=None):
+        """Listeyi/görünümü sayfa sayfa göster (render her sayfa için çağrılır)"""
+        if render is None:
+            def render(page):
+                for item in page:
+                    print(item)
+        
+        total_pages = max(1, (len(items) + page_size - 1) // page_size)
+        page_no = 0
+        
+        while True:
+            start = page_no * page_size
+            render(list(islice(items, start, start + page_size)))
+            
+            if total_pages == 1:
+                return
+            
+            print(f"\nSayfa {page_no + 1}/{total_pages} - S: Sonraki, G: Önceki, 0: Geri Dön")
+            choice = input("> ").strip().upper()
+            
+            if choice == "S" and page_no < total_pages - 1:
+                page_no += 1
+            elif choice == "G" and page_no > 0:
+                page_no -= 1
+            elif choice == "0":
+                return
+    
     @staticmethod
     def pause():
         """Devam etmek için bekle"""
         input("\nDevam etmek için Enter'a basın...")
     
+    @staticmethod
+    def write_frame(frame: bytes):
+        """Önceden UTF-8'e çevrilmiş ekranı tek os.write ile bas"""
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        
+        encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+        # Windows'ta os.write konsolun Unicode katmanını atlar (baytlar kod sayfasıyla okunur),
+        # bu yüzden orada, UTF-8 olmayan terminalde veya dosyasız stdout'ta normal yoldan yaz
+        if fd is None or os.name == "nt" or encoding != "utf8":
+            sys.stdout.write(frame.decode("utf-8"))
+            sys.stdout.flush()
+            return
+        
+        sys.stdout.flush()
+        view = memoryview(frame)
+        while view:
+            # os.write tüm baytları tek seferde yazmayabilir, kalanı tekrar dene
+            written = os.write(fd, view)
+            view = view[written:]
+    
     @staticmethod
     def clear_screen():
         """Ekranı temizle (cross-platform)"""
-        import os
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            os.system('cls')
+        else:
+            # Her redraw'da 'clear' süreci başlatmak yerine ANSI kodu ile temizle
+            sys.stdout.write("\x1b[H\x1b[J")
+            sys.stdout.flush()
 
 
 class TablePrinter:
@@ -159,26 +253,26 @@ class TablePrinter:
     @staticmethod
     def print_table(headers: list, rows: list, widths: list = None):
         """Tablo yazdır"""
+        # Hücreler bir kez metne çevrilir, genişlikler tek geçişte bulunur
+        header_cells = [str(h) for h in headers]
+        row_cells = [[str(cell) for cell in row] for row in rows]
         if widths is None:
-            widths = [max(len(str(row[i])) for row in [headers] + rows) + 2 
-                     for i in range(len(headers))]
-        
-        # Üst çizgi
-        print("┌" + "┬".join("─" * w for w in widths) + "┐")
-        
-        # Başlık
-        header_row = "│" + "│".join(f" {str(headers[i]):<{widths[i]-1}}" 
-                                     for i in range(len(headers))) + "│"
-        print(header_row)
+            widths = [len(h) + 2 for h in header_cells]
+            for cells in row_cells:
+                for i, cell in enumerate(cells):
+                    w = len(cell) + 2
+                    if w > widths[i]:
+                        widths[i] = w
         
-        # Ayırıcı
-        print("├" + "┼".join("─" * w for w in widths) + "┤")
+        def format_row(cells):
+            return "│" + "│".join(f" {cell:<{widths[i]-1}}" for i, cell in enumerate(cells)) + "│"
         
-        # Satırlar
-        for row in rows:
-            data_row = "│" + "│".join(f" {str(row[i]):<{widths[i]-1}}" 
-                                       for i in range(len(row))) + "│"
-            print(data_row)
+        lines = [
+            "┌" + "┬".join("─" * w for w in widths) + "┐",  # Üst çizgi
+            format_row(header_cells),  # Başlık
+            "├" + "┼".join("─" * w for w in widths) + "┤",  # Ayırıcı
+        ]
+        lines.extend(format_row(cells) for cells in row_cells)  # Satırlar
+        lines.append("└" + "┴".join("─" * w for w in widths) + "┘")  # Alt çizgi
         
-        # Alt çizgi
-        print("└" + "┴".join("─" * w for w in widths) + "┘")
\ No newline at end of file
+        print("\n".join(lines))
\ No newline at end of file